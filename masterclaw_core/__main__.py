@@ -11,6 +11,7 @@ def main():
         host=settings.HOST,
         port=settings.PORT,
         log_level=settings.LOG_LEVEL,
+        loop=settings.EVENT_LOOP,
         reload=settings.LOG_LEVEL == "debug",
     )
 
@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     PORT: int = 8000
     HOST: str = "0.0.0.0"
     LOG_LEVEL: str = "info"
+    EVENT_LOOP: str = "auto"  # auto (uvloop when installed), uvloop, asyncio
     
     # Security Configuration
     RATE_LIMIT_PER_MINUTE: int = 60
@@ -114,6 +115,18 @@ class Settings(BaseSettings):
             )
         return v_lower
     
+    @field_validator("EVENT_LOOP")
+    @classmethod
+    def validate_event_loop(cls, v: str) -> str:
+        """Validate event loop is one uvicorn can install"""
+        valid_loops = ("auto", "uvloop", "asyncio")
+        v_lower = v.lower()
+        if v_lower not in valid_loops:
+            raise ValueError(
+                f"EVENT_LOOP must be one of {valid_loops}, got '{v}'"
+            )
+        return v_lower
+    
     @field_validator("MEMORY_BACKEND")
     @classmethod
     def validate_memory_backend(cls, v: str) -> str:
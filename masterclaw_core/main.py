@@ -142,11 +142,14 @@ from .structured_logger import (
 )
 
 # Configure structured logging at startup
-# Use JSON format in production, console format in development
+# Use JSON format in production, console format in development; production
+# also moves formatting and I/O onto a background thread via a queue
+_is_production = settings.ENVIRONMENT in ("production", "prod")
 configure_logging(
     level=settings.LOG_LEVEL.upper(),
-    json_format=settings.ENVIRONMENT in ("production", "prod"),
-    include_context=True
+    json_format=_is_production,
+    include_context=True,
+    async_queue=_is_production
 )
 logger = get_logger("masterclaw")
 
@@ -242,6 +245,10 @@ async def lifespan(app: FastAPI):
     await shutdown_auto_responder()
     logger.info("Security auto-responder shutdown complete")
 
+    # Close pooled HTTP clients held by tools
+    await tool_registry.aclose()
+    logger.info("Tool registry shutdown complete")
+
 
 # Create FastAPI app with interactive API documentation
 app = FastAPI(
@@ -10,8 +10,9 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 # Valid session ID pattern: alphanumeric, hyphens, underscores only (1-64 chars)
-# Prevents injection attacks via session_id path parameter
-VALID_SESSION_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{1,64}$')
+# Prevents injection attacks via session_id path parameter. Unanchored: use
+# fullmatch(), since '$' would also accept a trailing newline
+VALID_SESSION_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]{1,64}')
 
 # Path traversal patterns (various encodings)
 PATH_TRAVERSAL_PATTERNS = [
@@ -24,7 +25,15 @@ PATH_TRAVERSAL_PATTERNS = [
 ]
 
 # Dangerous path characters that could enable command injection
-DANGEROUS_PATH_CHARS = re.compile(r'[;|&`$(){}[\]\n\r]')
+DANGEROUS_PATH_CHARS = ';|&`$(){}[]\n\r'
+
+# Deletion table for DANGEROUS_PATH_CHARS: str.translate scans the whole
+# string in C, so a length change means a dangerous character was present
+_DANGEROUS_PATH_TABLE = str.maketrans('', '', DANGEROUS_PATH_CHARS)
+
+# Deletion table for ASCII control characters (tab is kept for display)
+_CONTROL_CHAR_TABLE = dict.fromkeys([*range(0x20), 0x7f], None)
+del _CONTROL_CHAR_TABLE[ord('\t')]
 
 # Maximum allowed path length to prevent DoS
 MAX_PATH_LENGTH = 4096
@@ -82,7 +91,7 @@ def validate_session_id(session_id: Optional[str]) -> str:
         raise ValueError("Session ID cannot contain path traversal sequences")
     
     # Validate against pattern (alphanumeric, hyphens, underscores only)
-    if not VALID_SESSION_ID_PATTERN.match(session_id):
+    if not VALID_SESSION_ID_PATTERN.fullmatch(session_id):
         raise ValueError(
             "Session ID contains invalid characters. Only alphanumeric characters, "
             "hyphens, and underscores are allowed."
@@ -177,7 +186,7 @@ def validate_file_path(
         return False, "Path contains null bytes"
     
     # Check for dangerous characters (command injection)
-    if DANGEROUS_PATH_CHARS.search(path):
+    if len(path.translate(_DANGEROUS_PATH_TABLE)) != len(path):
         return False, "Path contains dangerous characters"
     
     # Normalize the path
@@ -228,7 +237,7 @@ def sanitize_path_for_display(path: str, max_length: int = 100) -> str:
     Prevents log injection by:
     - Truncating long paths
     - Removing control characters
-    - Escaping newlines
+    - Stripping newlines and carriage returns
     
     Args:
         path: The path to sanitize
@@ -247,11 +256,13 @@ def sanitize_path_for_display(path: str, max_length: int = 100) -> str:
     if not isinstance(path, str):
         path = str(path)
     
-    # Remove control characters except common whitespace
-    sanitized = ''.join(char for char in path if char.isprintable() or char in ' \t')
+    # Remove ASCII control characters (including CR/LF) in a single C-level pass
+    sanitized = path.translate(_CONTROL_CHAR_TABLE)
     
-    # Escape newlines for single-line display
-    sanitized = sanitized.replace('\n', '\\n').replace('\r', '\\r')
+    # Fall back to the per-character filter only for tabs or non-ASCII
+    # control/format characters that the table does not cover
+    if not sanitized.isprintable():
+        sanitized = ''.join(char for char in sanitized if char.isprintable() or char in ' \t')
     
     # Truncate if too long
     if len(sanitized) > max_length:
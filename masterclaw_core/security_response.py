@@ -13,6 +13,7 @@ automated defense-in-depth capabilities.
 """
 
 import asyncio
+import copy
 import json
 import logging
 import os
@@ -21,7 +22,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Callable
+from typing import Dict, List, Optional, Protocol, Set, Callable
 import ipaddress
 
 from .audit_logger import (
@@ -123,6 +124,81 @@ class ResponseRule:
         }
         
         return severity_levels.get(severity, 0) >= severity_levels.get(self.min_severity, 0)
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization"""
+        return {
+            "name": self.name,
+            "threat_types": self.threat_types,
+            "min_severity": self.min_severity.value,
+            "action": self.action.value,
+            "block_duration_minutes": self.block_duration_minutes,
+            "cooldown_minutes": self.cooldown_minutes,
+            "enabled": self.enabled,
+        }
+
+
+class FileBlocklistStore:
+    """Blocklist storage backed by a JSON file, written atomically"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+    
+    async def load(self) -> List[BlockedIP]:
+        """Load blocked IPs from disk, skipping malformed entries"""
+        if not self.path.exists():
+            return []
+        
+        with open(self.path, 'r') as f:
+            data = json.load(f)
+        
+        items = []
+        for item in data.get("blocked_ips", []):
+            try:
+                items.append(BlockedIP.from_dict(item))
+            except Exception as e:
+                logger.warning(f"Failed to load blocked IP entry: {e}")
+        return items
+    
+    async def save(self, items: List[BlockedIP]) -> None:
+        """Save blocked IPs to disk (errors propagate to the caller)"""
+        data = {
+            "updated_at": datetime.utcnow().isoformat(),
+            "blocked_ips": [ip.to_dict() for ip in items],
+        }
+        
+        # Write atomically
+        temp_path = self.path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        temp_path.replace(self.path)
+
+
+class MemoryBlocklistStore:
+    """In-memory blocklist storage, for tests and ephemeral deployments"""
+    
+    def __init__(self):
+        self._items: List[dict] = []
+    
+    async def load(self) -> List[BlockedIP]:
+        """Return the last saved blocked IPs"""
+        return [BlockedIP.from_dict(item) for item in self._items]
+    
+    async def save(self, items: List[BlockedIP]) -> None:
+        """Snapshot the blocked IPs (serialized, so later mutation doesn't leak in)"""
+        self._items = [ip.to_dict() for ip in items]
+
+
+class BlocklistStore(Protocol):
+    """Persistence backend for the blocklist; any object with these methods works"""
+    
+    async def load(self) -> List[BlockedIP]:
+        """Return the persisted blocked IPs"""
+        ...
+    
+    async def save(self, items: List[BlockedIP]) -> None:
+        """Persist the given blocked IPs, replacing what was stored"""
+        ...
 
 
 class SecurityAutoResponder:
@@ -181,14 +257,24 @@ class SecurityAutoResponder:
         self,
         blocklist_path: Optional[Path] = None,
         rules_path: Optional[Path] = None,
-        enabled: bool = True
+        enabled: bool = True,
+        enable_cleanup: bool = True,
+        store: Optional[BlocklistStore] = None
     ):
         self.enabled = enabled and os.getenv("SECURITY_AUTO_RESPONSE", "true").lower() == "true"
+        self.enable_cleanup = enable_cleanup  # Run the periodic expired-block cleanup task
+        
+        # A file store passed in without blocklist_path keeps its own path
+        if blocklist_path is None and isinstance(store, FileBlocklistStore):
+            blocklist_path = store.path
         
         # Use provided paths or defaults with fallback logic
         self.blocklist_path = blocklist_path or self.DEFAULT_BLOCKLIST_PATH
         self.rules_path = rules_path or self.DEFAULT_RULES_PATH
         
+        # Blocklist persistence backend (JSON file at blocklist_path by default)
+        self.store = store or FileBlocklistStore(self.blocklist_path)
+        
         self.blocked_ips: Dict[str, BlockedIP] = {}
         self.rules: List[ResponseRule] = []
         self._last_action_time: Dict[str, datetime] = {}  # Track cooldowns
@@ -260,7 +346,9 @@ class SecurityAutoResponder:
         original_blocklist_path = self.blocklist_path
         original_rules_path = self.rules_path
         
-        self.blocklist_path = self._ensure_writable_path(self.blocklist_path)
+        if isinstance(self.store, FileBlocklistStore):
+            self.store.path = self._ensure_writable_path(self.store.path)
+            self.blocklist_path = self.store.path
         self.rules_path = self._ensure_writable_path(self.rules_path)
         
         if self._using_fallback_paths:
@@ -283,7 +371,8 @@ class SecurityAutoResponder:
         
         # Start cleanup task
         self._running = True
-        self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
+        if self.enable_cleanup:
+            self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
         
         logger.info(
             f"Security auto-responder initialized: "
@@ -321,44 +410,25 @@ class SecurityAutoResponder:
         logger.info("Security auto-responder shutdown complete")
     
     async def _load_blocklist(self):
-        """Load blocked IPs from disk"""
-        if not self.blocklist_path.exists():
-            return
-        
+        """Load blocked IPs from the blocklist store"""
         try:
-            with open(self.blocklist_path, 'r') as f:
-                data = json.load(f)
-            
-            for item in data.get("blocked_ips", []):
-                try:
-                    blocked = BlockedIP.from_dict(item)
-                    if not blocked.is_expired():
-                        self.blocked_ips[blocked.ip_address] = blocked
-                except Exception as e:
-                    logger.warning(f"Failed to load blocked IP entry: {e}")
-            
-            logger.debug(f"Loaded {len(self.blocked_ips)} active blocks from disk")
-            
+            items = await self.store.load()
         except Exception as e:
             logger.error(f"Failed to load blocklist: {e}")
+            return
+        
+        for blocked in items:
+            if not blocked.is_expired():
+                self.blocked_ips[blocked.ip_address] = blocked
+        
+        logger.debug(f"Loaded {len(self.blocked_ips)} active blocks from store")
     
     async def _save_blocklist(self):
-        """Save blocked IPs to disk with graceful error handling."""
+        """Save blocked IPs to the blocklist store with graceful error handling."""
         try:
-            data = {
-                "updated_at": datetime.utcnow().isoformat(),
-                "blocked_ips": [
-                    ip.to_dict() for ip in self.blocked_ips.values()
-                ],
-            }
-            
-            # Write atomically
-            temp_path = self.blocklist_path.with_suffix('.tmp')
-            with open(temp_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            temp_path.replace(self.blocklist_path)
+            await self.store.save(list(self.blocked_ips.values()))
             
-            logger.debug(f"Saved {len(self.blocked_ips)} blocks to disk")
+            logger.debug(f"Saved {len(self.blocked_ips)} blocks to store")
             
         except PermissionError as e:
             logger.error(
@@ -399,9 +469,9 @@ class SecurityAutoResponder:
                 
             except Exception as e:
                 logger.error(f"Failed to load rules, using defaults: {e}")
-                self.rules = self.DEFAULT_RULES.copy()
+                self.rules = copy.deepcopy(self.DEFAULT_RULES)
         else:
-            self.rules = self.DEFAULT_RULES.copy()
+            self.rules = copy.deepcopy(self.DEFAULT_RULES)
             await self._save_rules()
     
     async def _save_rules(self):
@@ -409,18 +479,7 @@ class SecurityAutoResponder:
         try:
             data = {
                 "updated_at": datetime.utcnow().isoformat(),
-                "rules": [
-                    {
-                        "name": r.name,
-                        "threat_types": r.threat_types,
-                        "min_severity": r.min_severity.value,
-                        "action": r.action.value,
-                        "block_duration_minutes": r.block_duration_minutes,
-                        "cooldown_minutes": r.cooldown_minutes,
-                        "enabled": r.enabled,
-                    }
-                    for r in self.rules
-                ],
+                "rules": [r.to_dict() for r in self.rules],
             }
             
             # Write atomically
@@ -17,29 +17,163 @@ Usage:
         #          "request_id": "abc123", "user_id": "user456", "model": "gpt-4"}
 """
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-import uuid
-from contextvars import ContextVar
+import threading
+import time
+from contextvars import ContextVar, Token
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union
-from functools import wraps
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+from functools import lru_cache, wraps
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Context variables for request correlation
-_request_id: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
-_session_id: ContextVar[Optional[str]] = ContextVar('session_id', default=None)
-_user_id: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
-_client_ip: ContextVar[Optional[str]] = ContextVar('client_ip', default=None)
+
+class LogContext(NamedTuple):
+    """Snapshot of the request correlation context"""
+    request_id: Optional[str] = None
+    session_id: Optional[str] = None
+    user_id: Optional[str] = None
+    client_ip: Optional[str] = None
+
+
+_ContextPairs = Tuple[Tuple[str, str], ...]
+
+
+def _pack_context(context: LogContext) -> Tuple[LogContext, _ContextPairs]:
+    """Pair a context with its (field, value) items that are actually set"""
+    return context, tuple(
+        (field, value) for field, value in zip(LogContext._fields, context) if value
+    )
+
+
+# Request correlation context, held in one ContextVar so formatters pay for
+# a single lookup. The packed pairs let JSONFormatter copy only set fields
+# without testing each one per record.
+_EMPTY_CONTEXT = _pack_context(LogContext())
+_ctx: ContextVar[Tuple[LogContext, _ContextPairs]] = ContextVar(
+    'log_context', default=_EMPTY_CONTEXT
+)
+# Bound once; read on every formatted record
+_ctx_get = _ctx.get
+
+
+_urandom = os.urandom
+
+
+def _new_request_id() -> str:
+    """Short random request id: 8 hex chars from 4 random bytes"""
+    return _urandom(4).hex()
+
+
+class _ContextField:
+    """ContextVar-like view of one slot of the shared context tuple"""
+    
+    def __init__(self, index: int):
+        self._index = index
+    
+    def get(self) -> Optional[str]:
+        return _ctx_get()[0][self._index]
+    
+    def set(self, value: Optional[str]) -> Token:
+        current = list(_ctx_get()[0])
+        current[self._index] = value
+        return _ctx.set(_pack_context(LogContext(*current)))
+    
+    def reset(self, token: Token):
+        _ctx.reset(token)
+
+
+_request_id = _ContextField(0)
+_session_id = _ContextField(1)
+_user_id = _ContextField(2)
+_client_ip = _ContextField(3)
+
+# Bound once so the per-record formatters skip the ``logging`` module lookup
+_WARNING = logging.WARNING
+
+# LogRecord attributes that are never treated as structured extra data,
+# taken from a real record so new fields in later Pythons are covered
+_STANDARD_RECORD_FIELDS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None))
+) | {'message', 'asctime', 'structured_data'}
+
+
+def _stdlib_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log payload with the standard library encoder"""
+    return json.dumps(data, default=str)
+
+
+if ORJSON_AVAILABLE:
+    # OPT_SERIALIZE_NUMPY encodes arrays (e.g. embeddings) natively as JSON
+    # lists instead of through the str() default
+    _ORJSON_OPTIONS = (
+        orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+    def _orjson_compatible_default(obj: Any) -> Any:
+        """Render values the way orjson would when falling back to stdlib"""
+        if isinstance(obj, datetime):
+            return obj.isoformat().replace("+00:00", "Z")
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        return str(obj)
+
+    def _dumps(data: Dict[str, Any]) -> str:
+        """Serialize a log payload with orjson, falling back to stdlib json"""
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which orjson refuses
+            return json.dumps(data, default=_orjson_compatible_default)
+else:
+    _dumps = _stdlib_dumps
+
+
+def _snapshot_context() -> Dict[str, Any]:
+    """Collect the request context variables that are currently set"""
+    return dict(_ctx_get()[1])
+
+
+def _find_caller() -> Tuple[str, int, Optional[str]]:
+    """Return (pathname, lineno, function) of the first frame outside this module"""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return "(unknown file)", 0, None
+    return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
 
 
 class StructuredLogRecord(logging.LogRecord):
-    """Extended log record with structured data support"""
+    """
+    Extended log record with structured data support.
+    
+    Structured fields live in the single ``structured_data`` dict rather
+    than being copied onto the record one attribute at a time. They are
+    still readable as attributes (``record.model``) through
+    ``__getattr__``, which only runs for names the record itself lacks.
+    """
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.structured_data = {}
+    
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['structured_data'][name]
+        except KeyError:
+            raise AttributeError(name) from None
 
 
 class JSONFormatter(logging.Formatter):
@@ -51,9 +185,9 @@ class JSONFormatter(logging.Formatter):
     
     Example output:
         {
-            "timestamp": "2026-02-17T16:45:00.123Z",
             "level": "INFO",
             "logger": "masterclaw.chat",
+            "timestamp": "2026-02-17T16:45:00.123Z",
             "message": "Chat request processed",
             "request_id": "abc123",
             "session_id": "sess456",
@@ -71,19 +205,42 @@ class JSONFormatter(logging.Formatter):
         super().__init__()
         self.include_context = include_context
         self.flatten_extra = flatten_extra
+        self._ts_cache = (-1, "")
+        self._prefix_cache: Dict[Tuple[str, str], str] = {}
         self.timestamp_format = timestamp_format
     
+    @property
+    def timestamp_format(self) -> str:
+        return self._timestamp_format
+    
+    @timestamp_format.setter
+    def timestamp_format(self, value: str):
+        # Bind the matching formatter once instead of comparing per record
+        self._timestamp_format = value
+        if value == "iso":
+            self._format_timestamp = self._format_iso_timestamp
+        else:
+            self._format_timestamp = self._format_strftime_timestamp
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
-        log_data: Dict[str, Any] = {
-            "timestamp": self._format_timestamp(record.created),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
+        if self.flatten_extra:
+            # Flattened extras may reuse any key, so keep one plain object
+            log_data: Dict[str, Any] = {
+                "timestamp": self._format_timestamp(record.created),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+            }
+        else:
+            # "level" and "logger" are spliced in from a cached prefix
+            log_data = {
+                "timestamp": self._format_timestamp(record.created),
+                "message": record.getMessage(),
+            }
         
         # Add source location for debugging
-        if record.levelno >= logging.WARNING:
+        if record.levelno >= _WARNING:
             log_data["source"] = {
                 "file": record.pathname,
                 "line": record.lineno,
@@ -92,7 +249,7 @@ class JSONFormatter(logging.Formatter):
         
         # Add context variables if enabled
         if self.include_context:
-            context = self._get_context()
+            context = self._get_context(record)
             if context:
                 log_data.update(context)
         
@@ -108,51 +265,60 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self._format_exception(record.exc_info)
         
-        return json.dumps(log_data, default=str)
-    
-    def _format_timestamp(self, timestamp: float) -> str:
-        """Format timestamp according to configured format"""
+        if self.flatten_extra:
+            return _dumps(log_data)
+        return self._envelope_prefix(record.name, record.levelname) + _dumps(log_data)[1:]
+    
+    def _envelope_prefix(self, name: str, levelname: str) -> str:
+        """Cached '{"level": ..., "logger": ...,' opening for a logger/level pair"""
+        key = (name, levelname)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
+            prefix = _dumps({"level": levelname, "logger": name})[:-1] + ","
+            self._prefix_cache[key] = prefix
+        return prefix
+    
+    def _format_iso_timestamp(self, timestamp: float) -> str:
+        """Format timestamp as ISO 8601 UTC with millisecond precision"""
+        # Records arrive in bursts within the same second, so only the
+        # millisecond suffix is rebuilt until the second rolls over
+        sec = int(timestamp)
+        msec = int((timestamp - sec) * 1000)
+        cached_sec, cached_prefix = self._ts_cache
+        if sec != cached_sec:
+            cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_cache = (sec, cached_prefix)
+        return f"{cached_prefix}.{msec:03d}Z"
+    
+    def _format_strftime_timestamp(self, timestamp: float) -> str:
+        """Format timestamp with the configured strftime pattern"""
         dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        if self.timestamp_format == "iso":
-            return dt.isoformat().replace("+00:00", "Z")
-        return dt.strftime(self.timestamp_format)
-    
-    def _get_context(self) -> Dict[str, Any]:
-        """Get context variables"""
-        context = {}
-        req_id = _request_id.get()
-        if req_id:
-            context["request_id"] = req_id
-        sess_id = _session_id.get()
-        if sess_id:
-            context["session_id"] = sess_id
-        usr_id = _user_id.get()
-        if usr_id:
-            context["user_id"] = usr_id
-        ip = _client_ip.get()
-        if ip:
-            context["client_ip"] = ip
-        return context
+        return dt.strftime(self._timestamp_format)
+    
+    def _get_context(
+        self, record: Optional[logging.LogRecord] = None
+    ) -> Union[Dict[str, Any], _ContextPairs]:
+        """Get set context fields, preferring a snapshot carried on the record"""
+        captured = getattr(record, '_log_context', None)
+        if captured is not None:
+            return captured
+        return _ctx_get()[1]
     
     def _extract_extra_data(self, record: logging.LogRecord) -> Dict[str, Any]:
         """Extract extra fields from log record"""
-        # Standard logging fields to exclude
-        standard_fields = {
-            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-            'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-            'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-            'thread', 'threadName', 'processName', 'process', 'message',
-            'asctime', 'structured_data'
-        }
+        if type(record) is StructuredLogRecord:
+            return record.structured_data
         
-        extra = {}
-        for key, value in record.__dict__.items():
-            if key not in standard_fields and not key.startswith('_'):
-                extra[key] = value
+        # Records built outside StructuredLogger: diff against the standard fields
+        extra = {
+            key: value for key, value in record.__dict__.items()
+            if key not in _STANDARD_RECORD_FIELDS and key[:1] != '_'
+        }
         
         # Also check for structured_data attribute
-        if hasattr(record, 'structured_data'):
-            extra.update(record.structured_data)
+        structured_data = record.__dict__.get('structured_data')
+        if structured_data:
+            extra.update(structured_data)
         
         return extra
     
@@ -182,6 +348,9 @@ class ConsoleFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',   # Magenta
         'RESET': '\033[0m',
     }
+    _RESET = COLORS['RESET']
+    # Level -> escape prefix, resolved once so format() does a single lookup
+    _COLOR_PREFIXES = {k: v for k, v in COLORS.items() if k != 'RESET'}
     
     def __init__(self, use_colors: bool = True, include_context: bool = True):
         super().__init__(
@@ -190,35 +359,64 @@ class ConsoleFormatter(logging.Formatter):
         )
         self.use_colors = use_colors and sys.stdout.isatty()
         self.include_context = include_context
+        self._time_cache = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, reusing the string while the second is unchanged"""
+        if datefmt != self.datefmt:
+            return super().formatTime(record, datefmt)
+        # datefmt has whole-second resolution, so the string only changes
+        # when the second does
+        sec = int(record.created)
+        cached_sec, cached = self._time_cache
+        if sec != cached_sec:
+            cached = time.strftime(datefmt, self.converter(sec))
+            self._time_cache = (sec, cached)
+        return cached
     
     def format(self, record: logging.LogRecord) -> str:
         """Format with optional colors and context"""
-        # Get base formatted message
-        message = super().format(record)
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
         
-        # Add context info
+        # Context tag goes between the level and the message
+        context_str = ""
         if self.include_context:
-            context_parts = []
-            req_id = _request_id.get()
-            if req_id:
-                context_parts.append(f"req:{req_id}")
-            sess_id = _session_id.get()
-            if sess_id:
-                context_parts.append(f"sess:{sess_id}")
+            captured = getattr(record, '_log_context', None)
+            if captured is not None:
+                req_id = captured.get("request_id")
+                sess_id = captured.get("session_id")
+            else:
+                req_id, sess_id, _, _ = _ctx_get()[0]
             
-            if context_parts:
-                context_str = " [" + ", ".join(context_parts) + "]"
-                # Insert context before the message
-                parts = message.rsplit(' - ', 1)
-                if len(parts) == 2:
-                    message = f"{parts[0]}{context_str} - {parts[1]}"
+            if req_id and sess_id:
+                context_str = f" [req:{req_id}, sess:{sess_id}]"
+            elif req_id:
+                context_str = f" [req:{req_id}]"
+            elif sess_id:
+                context_str = f" [sess:{sess_id}]"
+        
+        # Exception and stack text, as logging.Formatter.format appends them
+        tail = ""
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            tail = f"\n{record.exc_text}"
+        if record.stack_info:
+            tail = f"{tail}\n{self.formatStack(record.stack_info)}"
         
-        # Add colors
+        # Colour codes come from the per-level table
         if self.use_colors:
-            color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-            message = f"{color}{message}{self.COLORS['RESET']}"
+            color = self._COLOR_PREFIXES.get(record.levelname, self._RESET)
+            reset = self._RESET
+        else:
+            color = reset = ""
         
-        return message
+        # Render the whole line, colour included, in a single f-string
+        return (
+            f"{color}{record.asctime} - {record.name} - {record.levelname}"
+            f"{context_str} - {record.message}{tail}{reset}"
+        )
 
 
 class StructuredLogger:
@@ -233,6 +431,8 @@ class StructuredLogger:
         logger.info("Request processed", model="gpt-4", tokens=150, duration_ms=123.45)
     """
     
+    __slots__ = ("logger", "name")
+    
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
         self.name = name
@@ -245,20 +445,44 @@ class StructuredLogger:
         **kwargs
     ):
         """Internal log method with structured data support"""
+        if not self.logger.isEnabledFor(level):
+            return
+        
         # Merge extra dict with kwargs
-        structured_data = {}
         if extra:
-            structured_data.update(extra)
-        structured_data.update(kwargs)
+            structured_data = dict(extra)
+            structured_data.update(kwargs)
+        else:
+            structured_data = kwargs
+        self._emit(level, message, structured_data)
+    
+    def _emit(self, level: int, message: str, structured_data: Dict[str, Any]):
+        """Build and dispatch a record; takes ownership of structured_data"""
+        # exc_info is a LogRecord field, not structured data; resolve it on
+        # the calling thread since sys.exc_info() is thread-local
+        exc_info = structured_data.pop('exc_info', None)
+        if isinstance(exc_info, BaseException):
+            exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+        elif exc_info is True:
+            exc_info = sys.exc_info()
         
-        # Create log record with structured data
-        record = self.logger.makeRecord(
-            self.name, level, "(unknown file)", 0, message, (), None
-        )
+        # Source location is only rendered for WARNING and above, so only
+        # those records pay for walking the stack
+        if level >= _WARNING:
+            pathname, lineno, func = _find_caller()
+        else:
+            pathname, lineno, func = "(unknown file)", 0, None
         
-        # Add structured data to record
-        for key, value in structured_data.items():
-            setattr(record, key, value)
+        # Create log record with structured data; fields that would shadow
+        # LogRecord attributes or are private are not structured data
+        record = StructuredLogRecord(
+            self.name, level, pathname, lineno, message, (), exc_info or None,
+            func=func
+        )
+        record.structured_data = {
+            key: value for key, value in structured_data.items()
+            if key not in _STANDARD_RECORD_FIELDS and key[:1] != '_'
+        }
         
         self.logger.handle(record)
     
@@ -296,19 +520,22 @@ class StructuredLogger:
         **kwargs
     ):
         """Log HTTP request with standard fields"""
-        level = logging.INFO if status_code < 400 else logging.WARNING
         if status_code >= 500:
             level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
         
-        self._log(
-            level,
-            f"{method} {path} - {status_code}",
-            method=method,
-            path=path,
-            status_code=status_code,
-            duration_ms=round(duration_ms, 2),
-            **kwargs
-        )
+        self._emit(level, f"{method} {path} - {status_code}", {
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration_ms": round(duration_ms, 2),
+            **kwargs,
+        })
     
     def log_chat(
         self,
@@ -319,15 +546,16 @@ class StructuredLogger:
         **kwargs
     ):
         """Log chat completion with standard fields"""
-        self._log(
-            logging.INFO,
-            f"Chat completion: {provider}/{model}",
-            provider=provider,
-            model=model,
-            tokens_used=tokens_used,
-            duration_ms=round(duration_ms, 2),
-            **kwargs
-        )
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._emit(logging.INFO, f"Chat completion: {provider}/{model}", {
+            "provider": provider,
+            "model": model,
+            "tokens_used": tokens_used,
+            "duration_ms": round(duration_ms, 2),
+            **kwargs,
+        })
 
 
 # =============================================================================
@@ -365,44 +593,39 @@ class request_context:
         user_id: Optional[str] = None,
         client_ip: Optional[str] = None
     ):
-        self.request_id = request_id or str(uuid.uuid4())[:8]
+        self.request_id = request_id or _new_request_id()
         self.session_id = session_id
         self.user_id = user_id
         self.client_ip = client_ip
-        self.tokens = []
+        self.token: Optional[Token] = None
     
     def __enter__(self):
         """Set context variables"""
-        self.tokens.append(_request_id.set(self.request_id))
-        if self.session_id:
-            self.tokens.append(_session_id.set(self.session_id))
-        if self.user_id:
-            self.tokens.append(_user_id.set(self.user_id))
-        if self.client_ip:
-            self.tokens.append(_client_ip.set(self.client_ip))
+        # Fields left unset inherit the enclosing context, as before
+        _, sess_id, usr_id, ip = _ctx_get()[0]
+        self.token = _ctx.set(_pack_context(LogContext(
+            self.request_id,
+            self.session_id or sess_id,
+            self.user_id or usr_id,
+            self.client_ip or ip,
+        )))
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clear context variables"""
-        for token in self.tokens:
+        if self.token is not None:
             try:
-                if token is not None:
-                    # Get which context var this token belongs to
-                    for var in [_request_id, _session_id, _user_id, _client_ip]:
-                        try:
-                            var.reset(token)
-                            break
-                        except ValueError:
-                            continue
-            except Exception:
-                pass  # Best effort cleanup
+                _ctx.reset(self.token)
+            except ValueError:
+                pass  # Best effort cleanup, e.g. exited from another context
+            self.token = None
     
     @classmethod
     def inject(cls, func):
         """Decorator to inject request context from function arguments"""
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            request_id = kwargs.get('request_id') or str(uuid.uuid4())[:8]
+            request_id = kwargs.get('request_id') or _new_request_id()
             session_id = kwargs.get('session_id')
             user_id = kwargs.get('user_id')
             client_ip = kwargs.get('client_ip')
@@ -413,7 +636,7 @@ class request_context:
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            request_id = kwargs.get('request_id') or str(uuid.uuid4())[:8]
+            request_id = kwargs.get('request_id') or _new_request_id()
             session_id = kwargs.get('session_id')
             user_id = kwargs.get('user_id')
             client_ip = kwargs.get('client_ip')
@@ -433,15 +656,253 @@ class request_context:
 # Convenience Functions
 # =============================================================================
 
+@lru_cache(maxsize=1024)
 def get_logger(name: str) -> StructuredLogger:
-    """Get a structured logger instance"""
+    """Get a structured logger instance (cached per name)"""
     return StructuredLogger(name)
 
 
+class HotStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler with the formatter and stream write bound up front.
+    
+    ``emit`` calls the bound ``format`` and ``write`` directly instead of
+    going through ``Handler.format`` and attribute lookups on every record.
+    The bindings are refreshed by ``setFormatter`` and ``setStream``.
+    """
+    
+    def __init__(self, stream=None, formatter: Optional[logging.Formatter] = None):
+        super().__init__(stream)
+        self._write = self.stream.write
+        self.setFormatter(formatter)
+    
+    def setFormatter(self, fmt: Optional[logging.Formatter]):
+        super().setFormatter(fmt)
+        self._format = (fmt or logging._defaultFormatter).format
+    
+    def setStream(self, stream):
+        result = super().setStream(stream)
+        self._write = self.stream.write
+        return result
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._write(self._format(record) + self.terminator)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Buffers per os.writev call; IOV_MAX on Linux and macOS
+_IOV_MAX = 1024
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that coalesces records into fewer stream writes.
+    
+    Formatted records are collected in memory and written in one call once
+    ``buffer_size`` characters are pending or a record at ``flush_level`` or
+    above arrives. A background timer writes anything still pending every
+    ``flush_interval`` seconds, so a quiet logger is not held back
+    indefinitely. ``close()`` (and so ``logging.shutdown``) drains whatever
+    is left.
+    """
+    
+    def __init__(
+        self,
+        stream=None,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.WARNING,
+        flush_interval: float = 1.0
+    ):
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._pending: list = []
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-buffer-flusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        
+        self._pending.append(msg)
+        self._pending_size += len(msg)
+        if self._should_flush(record):
+            try:
+                self.flush()
+            except Exception:
+                # Write failures (e.g. a closed stream) are reported like
+                # StreamHandler's, not raised into the logging caller
+                self.handleError(record)
+    
+    def _should_flush(self, record: logging.LogRecord) -> bool:
+        """Decide whether the record just buffered should trigger a write"""
+        return (
+            self._pending_size >= self.buffer_size
+            or record.levelno >= self.flush_level
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+    
+    def _flush_periodically(self):
+        while not self._stop_flushing.wait(self.flush_interval):
+            if self._pending:
+                try:
+                    self.flush()
+                except Exception:
+                    # The stream is unusable; emit() reports further failures
+                    return
+    
+    def _write_pending(self, pending: list):
+        """Write a batch of formatted records to the stream"""
+        self.stream.write("".join(pending))
+    
+    def flush(self):
+        """Write pending records in one call and flush the stream"""
+        self.acquire()
+        try:
+            if self._pending:
+                pending = self._pending
+                self._pending = []
+                self._pending_size = 0
+                self._write_pending(pending)
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+    
+    def close(self):
+        """Stop the background flusher and drain pending records"""
+        self._stop_flushing.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        try:
+            self.flush()
+        except (OSError, ValueError):
+            # Stream already closed; as in logging.shutdown, nothing to do
+            pass
+        finally:
+            super().close()
+
+
+class BatchingJSONHandler(BufferedStreamHandler):
+    """
+    High-throughput JSON handler that writes records in batches.
+    
+    Builds on BufferedStreamHandler by also flushing every ``batch_size``
+    records. When the stream is backed by a real file descriptor the batch
+    goes out through a single ``os.writev`` call; otherwise it is joined
+    and written to the stream.
+    """
+    
+    def __init__(
+        self,
+        stream=None,
+        batch_size: int = 256,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.ERROR,
+        flush_interval: float = 1.0
+    ):
+        super().__init__(stream, buffer_size, flush_level, flush_interval)
+        self.batch_size = batch_size
+        self.setFormatter(JSONFormatter())
+    
+    def _should_flush(self, record: logging.LogRecord) -> bool:
+        return len(self._pending) >= self.batch_size or super()._should_flush(record)
+    
+    def _write_pending(self, pending: list):
+        fd = self._fileno()
+        if fd is None:
+            super()._write_pending(pending)
+            return
+        
+        # Anything already sitting in the text layer has to go out first
+        self.stream.flush()
+        chunks = [msg.encode("utf-8") for msg in pending]
+        for start in range(0, len(chunks), _IOV_MAX):
+            batch = chunks[start:start + _IOV_MAX]
+            written = os.writev(fd, batch)
+            remaining = b"".join(batch)[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+    
+    def _fileno(self) -> Optional[int]:
+        """File descriptor for os.writev, or None when it cannot be used"""
+        if not hasattr(os, "writev"):
+            return None
+        try:
+            return self.stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+    
+    The stock ``prepare`` renders the record with a plain formatter and
+    drops ``exc_info``, which would strip the structured exception block
+    from JSON output. Here only the message arguments are merged, and the
+    request context is snapshotted onto the record because context
+    variables do not follow it to the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._log_context = _snapshot_context()
+        return record
+
+
+# Background listener installed by configure_logging(async_queue=True)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener():
+    """
+    Drain and stop the background log listener, if one is running.
+    
+    The listener's handlers are only referenced from here, so they are
+    flushed and closed before being dropped; otherwise records still
+    buffered in them would be lost when they are garbage collected.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        listener, _queue_listener = _queue_listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            try:
+                handler.flush()
+            finally:
+                handler.close()
+
+
+atexit.register(_stop_queue_listener)
+
+# Settings and root handler installed by the last configure_logging() call
+_logging_config: Optional[Tuple[tuple, logging.Handler]] = None
+
+
 def configure_logging(
     level: Union[int, str] = logging.INFO,
     json_format: bool = False,
-    include_context: bool = True
+    include_context: bool = True,
+    async_queue: bool = False,
+    buffered: Optional[bool] = None
 ):
     """
     Configure root logging with structured formatters.
@@ -450,17 +911,49 @@ def configure_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: Use JSON formatter for production (True) or console for development (False)
         include_context: Include request context in logs
+        async_queue: Hand records to a background thread through a queue so
+            callers only pay for an enqueue; formatting and I/O happen off
+            the calling thread. At exit the queue is drained and the
+            output handler flushed and closed
+        buffered: Coalesce writes with BufferedStreamHandler, which still
+            writes buffered records within a second; defaults to buffering
+            only when stdout is not an interactive terminal
     """
+    global _logging_config, _queue_listener
     if isinstance(level, str):
         level = getattr(logging, level.upper(), logging.INFO)
+    # Keep direct writes on a TTY for interactive latency
+    if buffered is None:
+        buffered = not sys.stdout.isatty()
     
-    # Remove existing handlers
+    # Repeated calls with the same settings keep the installed handler,
+    # as long as nothing has since replaced it or swapped out stdout
     root_logger = logging.getLogger()
+    config = (level, json_format, include_context, async_queue, buffered, sys.stdout)
+    if _logging_config is not None:
+        last_config, installed = _logging_config
+        if (
+            last_config == config
+            and root_logger.handlers == [installed]
+            and root_logger.level == level
+            and (not async_queue or _queue_listener is not None)
+        ):
+            return
+    
+    # Remove existing handlers, writing out anything they still buffer
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        try:
+            handler.flush()
+        finally:
+            handler.close()
     
     # Create handler
-    handler = logging.StreamHandler(sys.stdout)
+    if buffered:
+        handler: logging.StreamHandler = BufferedStreamHandler(sys.stdout)
+    else:
+        handler = HotStreamHandler(sys.stdout)
     handler.setLevel(level)
     
     # Set formatter
@@ -470,8 +963,16 @@ def configure_logging(
         formatter = ConsoleFormatter(include_context=include_context)
     
     handler.setFormatter(formatter)
+    if async_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        handler = _RecordQueueHandler(log_queue)
     root_logger.addHandler(handler)
     root_logger.setLevel(level)
+    _logging_config = (config, handler)
     
     # Set levels for specific loggers to reduce noise
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -480,12 +981,12 @@ def configure_logging(
 
 def get_current_context() -> Dict[str, Optional[str]]:
     """Get current request context for debugging"""
-    return {
-        "request_id": _request_id.get(),
-        "session_id": _session_id.get(),
-        "user_id": _user_id.get(),
-        "client_ip": _client_ip.get(),
-    }
+    return _ctx_get()[0]._asdict()
+
+
+def get_current_context_tuple() -> LogContext:
+    """Get current request context without building a dict"""
+    return _ctx_get()[0]
 
 
 # Global structured logger for masterclaw
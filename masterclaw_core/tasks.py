@@ -1,34 +1,60 @@
 """Background task queue for MasterClaw"""
 
 import asyncio
-from typing import Callable, Any
-from datetime import datetime, timezone
+from typing import Callable, Any, Optional
+import itertools
 import logging
-import uuid
 
 logger = logging.getLogger("masterclaw")
 
+# Process-wide task id sequence; ids only need to be unique per process
+_task_ids = itertools.count(1)
+
 
 class TaskQueue:
     """Simple async task queue for background processing"""
     
-    def __init__(self, max_workers: int = 5):
-        self.queue = asyncio.Queue()
+    # Default queue bound per worker when maxsize is not given
+    QUEUE_SIZE_PER_WORKER = 32
+    
+    def __init__(self, max_workers: int = 5, maxsize: Optional[int] = None):
+        """
+        Args:
+            max_workers: Number of concurrent worker tasks
+            maxsize: Maximum queued tasks before submit() waits for room;
+                defaults to max_workers * QUEUE_SIZE_PER_WORKER, 0 for unbounded
+        """
+        if maxsize is None:
+            maxsize = max_workers * self.QUEUE_SIZE_PER_WORKER
+        self.queue = asyncio.Queue(maxsize=maxsize)
         self.max_workers = max_workers
         self.workers = []
         self.running = False
+        # Set by stop() so producers waiting for room fail instead of hanging
+        self._stopped = asyncio.Event()
+        # Workers currently parked on queue.get(); stop() cancels only these
+        self._idle_workers = set()
     
     async def start(self):
         """Start the task queue workers"""
+        # Set before scheduling so no worker can observe running=False
         self.running = True
-        for i in range(self.max_workers):
-            worker = asyncio.create_task(self._worker_loop(f"worker-{i}"))
-            self.workers.append(worker)
+        self._stopped.clear()
+        loop = asyncio.get_running_loop()
+        self.workers.extend([
+            loop.create_task(self._worker_loop(f"worker-{i}"), name=f"tq-worker-{i}")
+            for i in range(self.max_workers)
+        ])
         logger.info(f"Task queue started with {self.max_workers} workers")
     
     async def stop(self):
         """Stop the task queue"""
         self.running = False
+        self._stopped.set()
+        # Idle workers are blocked on an empty queue and would never see the
+        # flag; busy workers finish their current task and then exit
+        for worker in self._idle_workers:
+            worker.cancel()
         # Wait for all workers to finish
         if self.workers:
             await asyncio.gather(*self.workers, return_exceptions=True)
@@ -37,45 +63,90 @@ class TaskQueue:
     
     async def _worker_loop(self, worker_id: str):
         """Worker loop to process tasks"""
+        current = asyncio.current_task()
         while self.running:
             try:
-                # Wait for task with timeout
-                task = await asyncio.wait_for(self.queue.get(), timeout=1.0)
-                await self._execute_task(task)
-                self.queue.task_done()  # Mark task as done
-            except asyncio.TimeoutError:
-                continue
+                # Block directly on the queue: a submit to an idle worker is
+                # handed over by the queue itself, with no polling timeout
+                # and no per-get wait_for task
+                self._idle_workers.add(current)
+                try:
+                    task = await self.queue.get()
+                finally:
+                    self._idle_workers.discard(current)
+                try:
+                    await self._execute_task(task)
+                finally:
+                    # Always mark done so queue.join() cannot hang on a
+                    # task that escaped _execute_task's own error handling
+                    self.queue.task_done()
+            except asyncio.CancelledError:
+                if self.running:
+                    raise
+                break  # Cancelled by stop() while idle
             except Exception as e:
                 logger.error(f"Worker {worker_id} error: {e}")
     
-    async def _execute_task(self, task: dict):
+    async def _execute_task(self, task: tuple):
         """Execute a single task"""
         try:
-            func = task['func']
-            args = task.get('args', [])
-            kwargs = task.get('kwargs', {})
+            _, func, args, kwargs, is_coroutine = task
             
-            if asyncio.iscoroutinefunction(func):
+            if is_coroutine:
                 await func(*args, **kwargs)
             else:
                 func(*args, **kwargs)
             
-            logger.debug(f"Task completed: {task.get('name', 'unnamed')}")
+            # Checked up front so the per-task message is never built
+            # while DEBUG is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task completed: %s", getattr(func, '__name__', 'unnamed'))
         except Exception as e:
             logger.error(f"Task failed: {e}")
     
     async def submit(self, func: Callable, *args, **kwargs) -> str:
-        """Submit a task to the queue"""
-        task_id = f"task_{datetime.now(timezone.utc).timestamp()}_{uuid.uuid4().hex[:8]}"
-        await self.queue.put({
-            'id': task_id,
-            'func': func,
-            'args': args,
-            'kwargs': kwargs,
-            'name': func.__name__,
-        })
+        """
+        Submit a task to the queue, waiting for room if it is full.
+        
+        Raises RuntimeError when the queue is stopped while full, including
+        for producers already waiting for room when stop() is called, since
+        no worker is left to make room. Tasks that enqueue follow-up work
+        should use submit_nowait(): if every worker is waiting here for
+        room, nothing drains the queue and submit() never returns.
+        """
+        task_id = f"task_{next(_task_ids)}"
+        item = self._make_item(task_id, func, args, kwargs)
+        if not self.queue.full():
+            self.queue.put_nowait(item)
+            return task_id
+        
+        if self._stopped.is_set():
+            raise RuntimeError("Task queue is stopped and full")
+        # Wait for room, but give up as soon as the queue is stopped
+        put = asyncio.ensure_future(self.queue.put(item))
+        stopped = asyncio.ensure_future(self._stopped.wait())
+        try:
+            await asyncio.wait((put, stopped), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopped.cancel()
+            if not put.done():
+                # A cancelled put never enqueues the item
+                put.cancel()
+        if not put.done() or put.cancelled():
+            raise RuntimeError("Task queue stopped while waiting for room")
         return task_id
     
+    def submit_nowait(self, func: Callable, *args, **kwargs) -> str:
+        """Submit a task without waiting; raises asyncio.QueueFull if full"""
+        task_id = f"task_{next(_task_ids)}"
+        self.queue.put_nowait(self._make_item(task_id, func, args, kwargs))
+        return task_id
+    
+    @staticmethod
+    def _make_item(task_id: str, func: Callable, args: tuple, kwargs: dict) -> tuple:
+        # Queue items are plain (id, func, args, kwargs, is_coroutine) tuples
+        return (task_id, func, args, kwargs, asyncio.iscoroutinefunction(func))
+    
     def get_queue_size(self) -> int:
         """Get current queue size"""
         return self.queue.qsize()
@@ -7,19 +7,32 @@ Built-in tools include GitHub integration, system commands, and more.
 
 import os
 import json
+import asyncio
+import signal
 import subprocess
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Callable, AsyncGenerator
+from typing import Dict, Any, Iterable, List, Optional, Callable, AsyncGenerator, Union
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
+from functools import cached_property, partial
 
 import httpx
 
+# Optional: faster JSON decoding of API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger("masterclaw.tools")
 
+# Timezone-aware "now" for ToolResult timestamps, bound once
+_utcnow = partial(datetime.now, timezone.utc)
+
 
-@dataclass
+@dataclass(slots=True)
 class ToolParameter:
     """Definition of a tool parameter"""
     name: str
@@ -28,9 +41,17 @@ class ToolParameter:
     required: bool = True
     default: Any = None
     enum: Optional[List[str]] = None
+    # Hashed copy of enum for membership checks during validation
+    _enum_set: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        if self.enum:
+            self._enum_set = frozenset(self.enum)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolDefinition:
     """Complete definition of a tool for LLM tool calling"""
     name: str
@@ -40,14 +61,28 @@ class ToolDefinition:
     dangerous: bool = False  # Requires extra security checks
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result of a tool execution"""
     success: bool
     data: Any = None
     error: Optional[str] = None
     logs: List[str] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utcnow)
+
+
+# Response bodies larger than this are decoded in a worker thread
+_JSON_OFFLOAD_BYTES = 64 * 1024
+
+
+async def _response_json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, off the event loop when it is large"""
+    if not ORJSON_AVAILABLE:
+        return resp.json()
+    content = resp.content
+    if len(content) > _JSON_OFFLOAD_BYTES:
+        return await asyncio.to_thread(orjson.loads, content)
+    return orjson.loads(content)
 
 
 class BaseTool(ABC):
@@ -56,7 +91,11 @@ class BaseTool(ABC):
     @property
     @abstractmethod
     def definition(self) -> ToolDefinition:
-        """Return the tool definition for LLM consumption"""
+        """Return the tool definition for LLM consumption
+        
+        Static definitions may be declared with ``functools.cached_property``
+        so they are built once per tool instance.
+        """
         pass
     
     @abstractmethod
@@ -72,8 +111,12 @@ class BaseTool(ABC):
             if param.required and param.name not in params:
                 return False, f"Required parameter '{param.name}' is missing"
             
-            if param.name in params and param.enum:
-                if params[param.name] not in param.enum:
+            if param._enum_set is not None and param.name in params:
+                try:
+                    allowed = params[param.name] in param._enum_set
+                except TypeError:  # unhashable values can't be enum members
+                    allowed = False
+                if not allowed:
                     return False, f"Parameter '{param.name}' must be one of: {param.enum}"
         
         return True, None
@@ -87,7 +130,7 @@ class GitHubTool(BaseTool):
     and creating comments.
     """
     
-    @property
+    @cached_property
     def definition(self) -> ToolDefinition:
         return ToolDefinition(
             name="github",
@@ -112,6 +155,21 @@ class GitHubTool(BaseTool):
     def __init__(self):
         self.token = os.getenv("GITHUB_TOKEN")
         self.base_url = "https://api.github.com"
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, so repeated actions reuse pooled connections"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=10)
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def execute(self, params: Dict[str, Any]) -> ToolResult:
         valid, error = self.validate_params(params)
@@ -156,14 +214,14 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/user/repos",
-                headers=headers,
-                params={"per_page": params.get("per_page", 30)}
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.get(
+            f"{self.base_url}/user/repos",
+            headers=headers,
+            params={"per_page": params.get("per_page", 30)}
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         repos = [
             {
@@ -194,13 +252,13 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/repos/{owner}/{repo}",
-                headers=headers
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.get(
+            f"{self.base_url}/repos/{owner}/{repo}",
+            headers=headers
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         return ToolResult(success=True, data={
             "name": data["name"],
@@ -229,17 +287,17 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/repos/{owner}/{repo}/issues",
-                headers=headers,
-                params={
-                    "state": params.get("state", "open"),
-                    "per_page": params.get("per_page", 30)
-                }
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.get(
+            f"{self.base_url}/repos/{owner}/{repo}/issues",
+            headers=headers,
+            params={
+                "state": params.get("state", "open"),
+                "per_page": params.get("per_page", 30)
+            }
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         issues = [
             {
@@ -271,13 +329,13 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}",
-                headers=headers
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.get(
+            f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}",
+            headers=headers
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         return ToolResult(success=True, data={
             "number": data["number"],
@@ -307,14 +365,14 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self.base_url}/repos/{owner}/{repo}/issues",
-                headers=headers,
-                json={"title": title, "body": body}
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.post(
+            f"{self.base_url}/repos/{owner}/{repo}/issues",
+            headers=headers,
+            json={"title": title, "body": body}
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         return ToolResult(success=True, data={
             "number": data["number"],
@@ -337,17 +395,17 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/repos/{owner}/{repo}/pulls",
-                headers=headers,
-                params={
-                    "state": params.get("state", "open"),
-                    "per_page": params.get("per_page", 30)
-                }
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.get(
+            f"{self.base_url}/repos/{owner}/{repo}/pulls",
+            headers=headers,
+            params={
+                "state": params.get("state", "open"),
+                "per_page": params.get("per_page", 30)
+            }
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         prs = [
             {
@@ -380,13 +438,13 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}",
-                headers=headers
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.get(
+            f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}",
+            headers=headers
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         return ToolResult(success=True, data={
             "number": data["number"],
@@ -422,14 +480,14 @@ class GitHubTool(BaseTool):
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments",
-                headers=headers,
-                json={"body": body}
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.post(
+            f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments",
+            headers=headers,
+            json={"body": body}
+        )
+        resp.raise_for_status()
+        data = await _response_json(resp)
         
         return ToolResult(success=True, data={
             "id": data["id"],
@@ -461,7 +519,10 @@ class SystemTool(BaseTool):
         "npm list", "pip list", "python --version", "node --version"
     ]
     
-    @property
+    # Seconds an exec command may run before it is killed
+    EXEC_TIMEOUT = 30
+    
+    @cached_property
     def definition(self) -> ToolDefinition:
         return ToolDefinition(
             name="system",
@@ -501,6 +562,46 @@ class SystemTool(BaseTool):
             logger.error(f"System tool error: {e}")
             return ToolResult(success=False, error=f"Error: {str(e)}")
     
+    @staticmethod
+    async def _run(args: Union[str, List[str]], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run a command without blocking the event loop.
+        
+        A string is run through the shell, so globs and ``~`` expand as
+        they would for subprocess.run(shell=True); a list is executed
+        directly. The command gets its own process group, and the whole
+        group is killed if it outlives the timeout, which is then reported
+        as subprocess.TimeoutExpired like subprocess.run would.
+        """
+        pipes = dict(
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        if isinstance(args, str):
+            proc = await asyncio.create_subprocess_shell(args, **pipes)
+        else:
+            proc = await asyncio.create_subprocess_exec(*args, **pipes)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            try:
+                # Take down anything the shell started, not just the shell
+                if hasattr(os, "killpg"):
+                    os.killpg(proc.pid, signal.SIGKILL)
+                else:
+                    proc.kill()
+            except ProcessLookupError:
+                pass  # Exited on its own in the meantime
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout)
+        return subprocess.CompletedProcess(
+            args,
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+    
     async def _get_info(self) -> ToolResult:
         """Get basic system information"""
         import platform
@@ -546,14 +647,7 @@ class SystemTool(BaseTool):
         
         try:
             # Execute with timeout
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=os.getcwd()
-            )
+            result = await self._run(command, self.EXEC_TIMEOUT)
             
             return ToolResult(
                 success=result.returncode == 0,
@@ -566,7 +660,7 @@ class SystemTool(BaseTool):
             )
         
         except subprocess.TimeoutExpired:
-            return ToolResult(success=False, error="Command timed out after 30 seconds")
+            return ToolResult(success=False, error=f"Command timed out after {self.EXEC_TIMEOUT} seconds")
         except Exception as e:
             return ToolResult(success=False, error=f"Execution failed: {str(e)}")
     
@@ -596,12 +690,7 @@ class SystemTool(BaseTool):
         normalized_path = os.path.normpath(path)
         
         try:
-            result = subprocess.run(
-                ["df", "-h", normalized_path],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = await self._run(["df", "-h", normalized_path], timeout=10)
             
             lines = result.stdout.strip().split("\n")
             if len(lines) >= 2:
@@ -623,12 +712,7 @@ class SystemTool(BaseTool):
     async def _memory_info(self) -> ToolResult:
         """Get memory information"""
         try:
-            result = subprocess.run(
-                ["free", "-h"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = await self._run(["free", "-h"], timeout=10)
             
             lines = result.stdout.strip().split("\n")
             data = {"raw": result.stdout}
@@ -651,12 +735,7 @@ class SystemTool(BaseTool):
     async def _processes(self) -> ToolResult:
         """Get top processes by CPU"""
         try:
-            result = subprocess.run(
-                ["ps", "aux", "--sort=-%cpu"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = await self._run(["ps", "aux", "--sort=-%cpu"], timeout=10)
             
             lines = result.stdout.strip().split("\n")
             # Header + top 10 processes
@@ -685,7 +764,7 @@ class WeatherTool(BaseTool):
     Provides current weather and forecasts without requiring API keys.
     """
     
-    @property
+    @cached_property
     def definition(self) -> ToolDefinition:
         return ToolDefinition(
             name="weather",
@@ -794,28 +873,46 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
+        # Serialized views of the registry, rebuilt after register/unregister
+        self._definitions: Optional[List[Dict[str, Any]]] = None
+        self._tools_info: Optional[List[Dict[str, Any]]] = None
         self._register_builtin_tools()
     
     def _register_builtin_tools(self):
         """Register all built-in tools"""
-        self.register(GitHubTool())
-        self.register(SystemTool())
-        self.register(WeatherTool())
+        self.register_many([GitHubTool(), SystemTool(), WeatherTool()])
     
     def register(self, tool: BaseTool) -> None:
         """Register a new tool"""
         name = tool.definition.name
         self._tools[name] = tool
+        self._definitions = self._tools_info = None
         logger.info(f"Registered tool: {name}")
     
+    def register_many(self, tools: Iterable[BaseTool]) -> None:
+        """Register several tools, rebuilding cached definitions only once"""
+        for tool in tools:
+            name = tool.definition.name
+            self._tools[name] = tool
+            logger.info(f"Registered tool: {name}")
+        self._definitions = self._tools_info = None
+    
     def unregister(self, name: str) -> bool:
         """Unregister a tool by name"""
         if name in self._tools:
             del self._tools[name]
+            self._definitions = self._tools_info = None
             logger.info(f"Unregistered tool: {name}")
             return True
         return False
     
+    async def aclose(self) -> None:
+        """Release resources held by registered tools"""
+        for tool in self._tools.values():
+            close = getattr(tool, "aclose", None)
+            if close is not None:
+                await close()
+    
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name"""
         return self._tools.get(name)
@@ -825,7 +922,18 @@ class ToolRegistry:
         return list(self._tools.keys())
     
     def get_definitions(self) -> List[Dict[str, Any]]:
-        """Get tool definitions for LLM consumption (OpenAI function format)"""
+        """
+        Get tool definitions for LLM consumption (OpenAI function format).
+        
+        The list is built once per registry change and shared between
+        callers, so it must not be modified.
+        """
+        if self._definitions is None:
+            self._definitions = self._build_definitions()
+        return self._definitions
+    
+    def _build_definitions(self) -> List[Dict[str, Any]]:
+        """Serialize every tool definition in OpenAI function format"""
         definitions = []
         
         for tool in self._tools.values():
@@ -865,7 +973,13 @@ class ToolRegistry:
         return definitions
     
     def get_tools_info(self) -> List[Dict[str, Any]]:
-        """Get information about all tools"""
+        """Get information about all tools (cached like get_definitions)"""
+        if self._tools_info is None:
+            self._tools_info = self._build_tools_info()
+        return self._tools_info
+    
+    def _build_tools_info(self) -> List[Dict[str, Any]]:
+        """Summarize every registered tool"""
         info = []
         for tool in self._tools.values():
             defn = tool.definition
@@ -12,7 +12,8 @@ import json
 import re
 import time
 import logging
-from typing import Dict, Set, Optional
+from collections import deque
+from typing import Callable, Deque, Dict, Set, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
@@ -30,7 +31,7 @@ CONNECTION_TIMEOUT_SECONDS = 3600  # 1 hour max connection duration
 SESSION_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{1,64}$')  # Valid session ID format
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionInfo:
     """Tracks connection metadata for security enforcement"""
     websocket: WebSocket
@@ -49,28 +50,39 @@ class ConnectionInfo:
         self.message_count += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitInfo:
     """Tracks rate limiting data per client"""
-    message_times: list = field(default_factory=list)
+    # Only the newest RATE_LIMIT_MAX_MESSAGES timestamps can decide the limit
+    message_times: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=RATE_LIMIT_MAX_MESSAGES)
+    )
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False, compare=False)
     
     def is_rate_limited(self) -> bool:
         """Check if client has exceeded rate limit"""
-        now = time.time()
-        window_start = now - RATE_LIMIT_WINDOW
-        # Remove old entries
-        self.message_times = [t for t in self.message_times if t > window_start]
-        return len(self.message_times) >= RATE_LIMIT_MAX_MESSAGES
+        window_start = self.clock() - RATE_LIMIT_WINDOW
+        # Remove old entries; timestamps are recorded in order
+        times = self.message_times
+        while times and times[0] <= window_start:
+            times.popleft()
+        return len(times) >= RATE_LIMIT_MAX_MESSAGES
     
     def record_message(self):
         """Record a message timestamp"""
-        self.message_times.append(time.time())
+        self.message_times.append(self.clock())
 
 
 class ConnectionManager:
     """Manages WebSocket connections with security hardening"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_connections_per_session: int = MAX_CONNECTIONS_PER_SESSION,
+        max_connections_per_ip: int = MAX_CONNECTIONS_PER_IP,
+    ):
+        self.max_connections_per_session = max_connections_per_session
+        self.max_connections_per_ip = max_connections_per_ip
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         self.connection_info: Dict[WebSocket, ConnectionInfo] = {}
         self.connections_by_ip: Dict[str, Set[WebSocket]] = {}
@@ -112,14 +124,14 @@ class ConnectionManager:
         
         # Check IP-based connection limit
         current_ip_connections = len(self.connections_by_ip.get(client_ip, set()))
-        if current_ip_connections >= MAX_CONNECTIONS_PER_IP:
+        if current_ip_connections >= self.max_connections_per_ip:
             logger.warning(f"WebSocket connection rejected: IP {client_ip} has too many connections ({current_ip_connections})")
             await websocket.close(code=4002, reason="Too many connections from this IP")
             return False
         
         # Check session-based connection limit
         current_session_connections = len(self.active_connections.get(session_id, set()))
-        if current_session_connections >= MAX_CONNECTIONS_PER_SESSION:
+        if current_session_connections >= self.max_connections_per_session:
             logger.warning(f"WebSocket connection rejected: session {session_id} has too many connections ({current_session_connections})")
             await websocket.close(code=4003, reason="Too many connections for this session")
             return False
@@ -264,8 +276,8 @@ class ConnectionManager:
             "total_connections": total_connections,
             "unique_sessions": len(self.active_connections),
             "unique_ips": len(self.connections_by_ip),
-            "max_connections_per_session": MAX_CONNECTIONS_PER_SESSION,
-            "max_connections_per_ip": MAX_CONNECTIONS_PER_IP,
+            "max_connections_per_session": self.max_connections_per_session,
+            "max_connections_per_ip": self.max_connections_per_ip,
             "rate_limit_window": RATE_LIMIT_WINDOW,
             "rate_limit_max_messages": RATE_LIMIT_MAX_MESSAGES,
         }
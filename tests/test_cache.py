@@ -115,6 +115,7 @@ class TestCacheClientBasicOperations:
         result = memory_cache_client.delete("nonexistent")
         assert result is False
     
+    @pytest.mark.slow
     def test_expired_key_returns_none(self, memory_cache_client):
         """Test that expired keys return None"""
         # Set with very short TTL
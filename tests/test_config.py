@@ -254,6 +254,25 @@ class TestLogLevelValidation:
         assert "LOG_LEVEL must be one of" in str(exc_info.value)
 
 
+class TestEventLoopValidation:
+    """Test EVENT_LOOP validation"""
+    
+    def test_default_event_loop(self):
+        """Test the default lets uvicorn pick uvloop when installed"""
+        assert Settings().EVENT_LOOP == "auto"
+    
+    def test_valid_event_loops(self):
+        """Test valid event loops are normalized"""
+        for loop in ["auto", "uvloop", "asyncio"]:
+            assert Settings(EVENT_LOOP=loop.upper()).EVENT_LOOP == loop
+    
+    def test_invalid_event_loop(self):
+        """Test invalid event loop is rejected"""
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(EVENT_LOOP="trio")
+        assert "EVENT_LOOP must be one of" in str(exc_info.value)
+
+
 class TestMemoryBackendValidation:
     """Test MEMORY_BACKEND validation"""
     
@@ -214,6 +214,7 @@ class TestRequestDeduplicationMiddleware:
 class TestDeduplicationDecorator:
     """Test suite for the @deduplicate decorator"""
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_deduplicate_decorator_basic(self):
         """Test basic deduplication with decorator"""
@@ -241,6 +242,7 @@ class TestDeduplicationDecorator:
         # All should get the same result
         assert all(r == {"result": "call_1"} for r in results)
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_deduplicate_decorator_different_keys(self):
         """Test that different keys are not deduplicated"""
@@ -280,6 +282,7 @@ class TestDeduplicationManager:
         manager = DeduplicationManager()
         assert manager.ttl_seconds == 5.0
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_acquire_leader_yields_self(self):
         """Test that the first (leader) caller gets 'self' yielded"""
@@ -289,6 +292,7 @@ class TestDeduplicationManager:
             # Leader should get the manager instance as context
             assert ctx is manager
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_acquire_follower_yields_none(self):
         """Test that subsequent (follower) callers get None yielded after leader completes"""
@@ -311,6 +315,7 @@ class TestDeduplicationManager:
         assert results[0] == ("leader", manager)
         assert results[1] == ("follower", None)
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_acquire_deduplicates_concurrent_calls(self):
         """Test that concurrent calls with same key are deduplicated"""
@@ -330,6 +335,7 @@ class TestDeduplicationManager:
         # Should only execute once
         assert call_count == 1
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_acquire_different_keys_not_deduplicated(self):
         """Test that different keys are not deduplicated"""
@@ -370,6 +376,7 @@ class TestDeduplicationManager:
         # Should have 2 calls
         assert len(call_times) == 2
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_acquire_exception_propagation(self):
         """Test that exceptions in leader are properly handled"""
@@ -436,6 +443,7 @@ class TestDeduplicationManager:
 class TestIntegration:
     """Integration tests with FastAPI"""
     
+    @pytest.mark.slow
     def test_deduplication_integration(self):
         """Test deduplication with actual FastAPI app"""
         call_count = 0
@@ -168,6 +168,7 @@ class TestRateLimitMiddleware:
         response3 = client.get("/", headers={"X-Forwarded-For": "5.6.7.8, 1.2.3.4"})
         assert response3.status_code == 200
         
+    @pytest.mark.slow
     def test_cleanup_stale_entries(self):
         """Test that stale entries are cleaned up"""
         app = FastAPI()
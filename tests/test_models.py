@@ -7,12 +7,17 @@ from masterclaw_core.models import (
 )
 
 
+# Shared valid request; tests that only tweak a field use model_copy()
+# instead of running the full validator pipeline again.
+_BASE_CHAT_REQUEST = ChatRequest(message="Hello")
+
+
 class TestChatRequest:
     """Test ChatRequest model validation"""
     
     def test_valid_chat_request(self):
         """Test creating a valid chat request"""
-        request = ChatRequest(message="Hello")
+        request = _BASE_CHAT_REQUEST
         assert request.message == "Hello"
         assert request.temperature == 0.7
         assert request.use_memory is True
@@ -133,7 +138,7 @@ class TestModelSerialization:
     
     def test_chat_request_json(self):
         """Test ChatRequest can be serialized to JSON"""
-        request = ChatRequest(message="Hello", session_id="abc")
+        request = _BASE_CHAT_REQUEST.model_copy(update={"session_id": "abc"})
         json_data = request.model_dump()
         assert json_data["message"] == "Hello"
         assert json_data["session_id"] == "abc"
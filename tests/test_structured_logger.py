@@ -12,6 +12,7 @@ import json
 import logging
 import pytest
 import sys
+import time
 from datetime import datetime
 from io import StringIO
 from unittest.mock import patch, MagicMock
@@ -20,14 +21,21 @@ from masterclaw_core.structured_logger import (
     JSONFormatter,
     ConsoleFormatter,
     StructuredLogger,
+    StructuredLogRecord,
+    BufferedStreamHandler,
+    BatchingJSONHandler,
+    HotStreamHandler,
     request_context,
     get_logger,
     configure_logging,
     get_current_context,
+    get_current_context_tuple,
+    LogContext,
     _request_id,
     _session_id,
     _user_id,
     _client_ip,
+    _stdlib_dumps,
 )
 
 
@@ -72,6 +80,37 @@ class TestJSONFormatter:
         assert data["timestamp"].endswith("Z")
         assert "T" in data["timestamp"]
     
+    def test_iso_timestamp_millisecond_precision(self):
+        """Test ISO timestamps carry milliseconds across second boundaries"""
+        formatter = JSONFormatter()
+        
+        assert formatter._format_timestamp(1708195200.25) == "2024-02-17T18:40:00.250Z"
+        assert formatter._format_timestamp(1708195200.5) == "2024-02-17T18:40:00.500Z"
+        assert formatter._format_timestamp(1708195201.0) == "2024-02-17T18:40:01.000Z"
+    
+    def test_custom_timestamp_format(self):
+        """Test strftime timestamp formats, including after reassignment"""
+        formatter = JSONFormatter(timestamp_format="%Y-%m-%d")
+        assert formatter._format_timestamp(1708195200.0) == "2024-02-17"
+        
+        formatter.timestamp_format = "iso"
+        assert formatter._format_timestamp(1708195200.0) == "2024-02-17T18:40:00.000Z"
+    
+    def test_envelope_prefix_cached_per_logger_and_level(self):
+        """Test level/logger lead the object and the opening is reused"""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test.prefix", level=logging.INFO, pathname="/test.py",
+            lineno=1, msg="Test", args=(), exc_info=None
+        )
+        
+        first = formatter.format(record)
+        second = formatter.format(record)
+        
+        assert list(json.loads(first))[:2] == ["level", "logger"]
+        assert json.loads(second)["logger"] == "test.prefix"
+        assert list(formatter._prefix_cache) == [("test.prefix", "INFO")]
+    
     def test_extra_fields_included(self):
         """Test that extra fields are included in output"""
         formatter = JSONFormatter()
@@ -155,6 +194,36 @@ class TestJSONFormatter:
         assert data["exception"]["type"] == "ValueError"
         assert "Test error" in data["exception"]["message"]
         assert data["exception"]["traceback"] is not None
+    
+    def test_stdlib_fallback_matches_fast_path(self):
+        """Test the stdlib serializer produces the same payload as the fast path"""
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py",
+            lineno=1, msg="Test", args=(), exc_info=None
+        )
+        record.created = 1708195200.0
+        record.model = "gpt-4"
+        
+        fast = json.loads(JSONFormatter().format(record))
+        with patch("masterclaw_core.structured_logger.ORJSON_AVAILABLE", False), \
+                patch("masterclaw_core.structured_logger._dumps", _stdlib_dumps):
+            slow = json.loads(JSONFormatter().format(record))
+        
+        assert fast == slow
+    
+    def test_oversized_int_falls_back_to_stdlib(self):
+        """Test values the fast encoder rejects are still serialized"""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py",
+            lineno=1, msg="Test", args=(), exc_info=None
+        )
+        record.big = 2 ** 70
+        
+        data = json.loads(formatter.format(record))
+        
+        assert data["extra"]["big"] == 2 ** 70
+        assert data["timestamp"].endswith("Z")
 
 
 class TestConsoleFormatter:
@@ -177,6 +246,21 @@ class TestConsoleFormatter:
         assert "INFO" in output
         assert "Test message" in output
     
+    def test_format_time_matches_stdlib(self):
+        """Test cached console timestamps match logging.Formatter output"""
+        formatter = ConsoleFormatter(use_colors=False)
+        reference = logging.Formatter(datefmt=formatter.datefmt)
+        
+        for created in (1708195200.1, 1708195200.9, 1708195201.0):
+            record = logging.LogRecord(
+                name="test", level=logging.INFO,
+                pathname="/test.py", lineno=1,
+                msg="Test", args=(), exc_info=None
+            )
+            record.created = created
+            assert formatter.formatTime(record, formatter.datefmt) == \
+                reference.formatTime(record, formatter.datefmt)
+    
     def test_context_in_output(self):
         """Test context variables appear in output"""
         formatter = ConsoleFormatter(use_colors=False)
@@ -197,6 +281,51 @@ class TestConsoleFormatter:
         finally:
             _request_id.reset(token)
     
+    def test_request_and_session_context_in_output(self):
+        """Test request and session ids are rendered together"""
+        formatter = ConsoleFormatter(use_colors=False)
+        record = logging.LogRecord(
+            name="test", level=logging.INFO,
+            pathname="/test.py", lineno=1,
+            msg="Test", args=(), exc_info=None
+        )
+        
+        with request_context(request_id="abc123", session_id="sess-1"):
+            output = formatter.format(record)
+        
+        assert output.endswith("INFO [req:abc123, sess:sess-1] - Test")
+    
+    def test_context_placed_before_message_with_separator(self):
+        """Test context lands after the level even if the message contains ' - '"""
+        formatter = ConsoleFormatter(use_colors=False)
+        record = logging.LogRecord(
+            name="test", level=logging.INFO,
+            pathname="/test.py", lineno=1,
+            msg="GET /v1/chat - 200", args=(), exc_info=None
+        )
+        
+        with request_context(request_id="abc123"):
+            output = formatter.format(record)
+        
+        assert output.endswith("INFO [req:abc123] - GET /v1/chat - 200")
+    
+    def test_exception_text_appended(self):
+        """Test tracebacks follow the log line"""
+        formatter = ConsoleFormatter(use_colors=False)
+        try:
+            raise ValueError("console boom")
+        except ValueError:
+            record = logging.LogRecord(
+                name="test", level=logging.ERROR,
+                pathname="/test.py", lineno=1,
+                msg="Failed", args=(), exc_info=sys.exc_info()
+            )
+        
+        output = formatter.format(record)
+        
+        assert "ERROR - Failed\nTraceback" in output
+        assert output.rstrip().endswith("ValueError: console boom")
+    
     def test_colors_for_tty(self):
         """Test colors are used when output is TTY"""
         formatter = ConsoleFormatter(use_colors=True)
@@ -264,7 +393,8 @@ class TestRequestContext:
         with request_context() as ctx:
             req_id = _request_id.get()
             assert req_id is not None
-            assert len(req_id) == 8  # First 8 chars of UUID
+            assert len(req_id) == 8  # 4 random bytes as hex
+            int(req_id, 16)
     
     def test_nested_context(self):
         """Test nested context blocks"""
@@ -277,6 +407,18 @@ class TestRequestContext:
             # Should restore outer context
             assert _request_id.get() == "outer"
     
+    def test_nested_context_inherits_unset_fields(self):
+        """Test inner blocks keep outer fields they do not override"""
+        with request_context(request_id="outer", session_id="sess-1"):
+            with request_context(request_id="inner", user_id="user-1"):
+                assert get_current_context() == {
+                    "request_id": "inner",
+                    "session_id": "sess-1",
+                    "user_id": "user-1",
+                    "client_ip": None,
+                }
+            assert _user_id.get() is None
+    
     def test_get_current_context(self):
         """Test get_current_context helper"""
         with request_context(
@@ -293,6 +435,18 @@ class TestRequestContext:
             assert ctx["client_ip"] == "192.168.1.1"
 
 
+    def test_get_current_context_tuple(self):
+        """Test the tuple accessor exposes the same fields by name"""
+        assert get_current_context_tuple() == LogContext()
+        
+        with request_context(request_id="req-1", client_ip="10.0.0.1"):
+            ctx = get_current_context_tuple()
+            
+            assert ctx.request_id == "req-1"
+            assert ctx.client_ip == "10.0.0.1"
+            assert ctx._asdict() == get_current_context()
+
+
 class TestStructuredLogger:
     """Tests for StructuredLogger"""
     
@@ -324,6 +478,22 @@ class TestStructuredLogger:
         assert record.model == "gpt-4"
         assert record.tokens == 100
     
+    def test_structured_fields_kept_in_structured_data(self, mock_handler):
+        """Test records carry their fields in one dict, readable as attributes"""
+        logger = StructuredLogger("test.logger")
+        logger.logger.addHandler(mock_handler)
+        logger.logger.setLevel(logging.INFO)
+        
+        logger.info("Test message", model="gpt-4", _internal=1)
+        
+        record = mock_handler.records[0]
+        assert isinstance(record, StructuredLogRecord)
+        assert record.structured_data == {"model": "gpt-4"}
+        assert "model" not in record.__dict__
+        assert record.model == "gpt-4"
+        assert not hasattr(record, "_internal")
+        assert JSONFormatter()._extract_extra_data(record) == {"model": "gpt-4"}
+    
     def test_error_logging(self, mock_handler):
         """Test error level logging"""
         logger = StructuredLogger("test.logger")
@@ -338,6 +508,20 @@ class TestStructuredLogger:
         assert record.error_code == "E123"
         assert record.retryable is True
     
+    def test_source_location_for_warnings(self, mock_handler):
+        """Test WARNING+ records point at the calling code, INFO skips the lookup"""
+        logger = StructuredLogger("test.logger")
+        logger.logger.addHandler(mock_handler)
+        logger.logger.setLevel(logging.INFO)
+        
+        logger.info("No source")
+        logger.warning("With source")
+        
+        info_record, warning_record = mock_handler.records
+        assert info_record.lineno == 0
+        assert warning_record.pathname == __file__
+        assert warning_record.funcName == "test_source_location_for_warnings"
+    
     def test_log_request_method(self, mock_handler):
         """Test log_request convenience method"""
         logger = StructuredLogger("test.logger")
@@ -370,6 +554,19 @@ class TestStructuredLogger:
         assert len(mock_handler.records) == 1
         assert mock_handler.records[0].levelno == logging.ERROR
     
+    def test_disabled_level_not_emitted(self, mock_handler):
+        """Test records below the logger's level never reach handlers"""
+        logger = StructuredLogger("test.logger.disabled")
+        logger.logger.addHandler(mock_handler)
+        logger.logger.setLevel(logging.WARNING)
+        
+        logger.debug("Dropped", detail="x")
+        logger.info("Dropped", detail="x")
+        logger.log_request("GET", "/ok", 200, 1.0)
+        logger.log_chat("openai", "gpt-4", 10, 1.0)
+        
+        assert mock_handler.records == []
+    
     def test_log_chat_method(self, mock_handler):
         """Test log_chat convenience method"""
         logger = StructuredLogger("test.logger")
@@ -409,6 +606,10 @@ class TestGetLogger:
         
         assert logger1.name == "module1"
         assert logger2.name == "module2"
+    
+    def test_same_name_returns_cached_logger(self):
+        """Test repeated calls with the same name return the same instance"""
+        assert get_logger("module.cached") is get_logger("module.cached")
 
 
 class TestConfigureLogging:
@@ -475,6 +676,161 @@ class TestConfigureLogging:
             assert logger is not None  # Logger exists
 
 
+class TestBufferedStreamHandler:
+    """Tests for BufferedStreamHandler"""
+    
+    @staticmethod
+    def _record(level=logging.INFO, msg="Test"):
+        return logging.LogRecord(
+            name="test", level=level, pathname="/test.py",
+            lineno=1, msg=msg, args=(), exc_info=None
+        )
+    
+    def test_info_records_held_until_flush(self):
+        """Test low-severity records are buffered rather than written"""
+        stream = StringIO()
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+        
+        handler.handle(self._record(msg="first"))
+        handler.handle(self._record(msg="second"))
+        assert stream.getvalue() == ""
+        
+        handler.flush()
+        assert stream.getvalue() == "first\nsecond\n"
+    
+    def test_warning_flushes_pending_records(self):
+        """Test a WARNING record writes itself and everything before it"""
+        stream = StringIO()
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+        
+        handler.handle(self._record(msg="info"))
+        handler.handle(self._record(level=logging.WARNING, msg="warn"))
+        
+        assert stream.getvalue() == "info\nwarn\n"
+    
+    def test_closed_stream_reported_not_raised(self):
+        """Test a failed write goes to handleError instead of the caller"""
+        stream = StringIO()
+        stream.close()
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+        
+        with patch.object(handler, "handleError") as handle_error:
+            handler.handle(self._record(level=logging.WARNING, msg="warn"))
+        handle_error.assert_called_once()
+    
+    def test_buffer_size_triggers_write(self):
+        """Test reaching buffer_size writes the pending batch"""
+        stream = MagicMock()
+        handler = BufferedStreamHandler(stream, buffer_size=10, flush_interval=60)
+        
+        handler.handle(self._record(msg="1234"))
+        stream.write.assert_not_called()
+        handler.handle(self._record(msg="5678"))
+        
+        stream.write.assert_called_once_with("1234\n5678\n")
+
+
+    def test_timer_flushes_quiet_logger(self):
+        """Test pending records are written without further logging"""
+        stream = StringIO()
+        handler = BufferedStreamHandler(stream, flush_interval=0.05)
+        try:
+            handler.handle(self._record(msg="idle"))
+            deadline = time.monotonic() + 2
+            while not stream.getvalue() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            
+            assert stream.getvalue() == "idle\n"
+        finally:
+            handler.close()
+    
+    def test_close_drains_pending_records(self):
+        """Test close writes what is still buffered"""
+        stream = StringIO()
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+        
+        handler.handle(self._record(msg="pending"))
+        handler.close()
+        
+        assert stream.getvalue() == "pending\n"
+
+
+class TestHotStreamHandler:
+    """Tests for HotStreamHandler"""
+    
+    def test_emits_with_bound_formatter_and_stream(self):
+        """Test records are formatted and written through the bound callables"""
+        first, second = StringIO(), StringIO()
+        handler = HotStreamHandler(first, JSONFormatter())
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py",
+            lineno=1, msg="Hot", args=(), exc_info=None
+        )
+        
+        handler.handle(record)
+        handler.setStream(second)
+        handler.setFormatter(None)
+        handler.handle(record)
+        
+        assert isinstance(json.loads(first.getvalue()), dict)
+        assert second.getvalue() == "Hot\n"
+
+
+class TestBatchingJSONHandler:
+    """Tests for BatchingJSONHandler"""
+    
+    @staticmethod
+    def _record(msg):
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py",
+            lineno=1, msg=msg, args=(), exc_info=None
+        )
+    
+    def test_batch_size_triggers_single_write(self):
+        """Test records are written together once batch_size is reached"""
+        stream = MagicMock()
+        stream.fileno.side_effect = OSError
+        handler = BatchingJSONHandler(stream, batch_size=3, flush_interval=60)
+        try:
+            handler.handle(self._record("one"))
+            handler.handle(self._record("two"))
+            stream.write.assert_not_called()
+            
+            handler.handle(self._record("three"))
+            
+            stream.write.assert_called_once()
+            lines = stream.write.call_args[0][0].splitlines()
+            assert [json.loads(line)["message"] for line in lines] == ["one", "two", "three"]
+        finally:
+            handler.close()
+    
+    def test_writev_to_file_descriptor(self, tmp_path):
+        """Test batches go straight to the file descriptor and drain on close"""
+        path = tmp_path / "batch.log"
+        with open(path, "w") as stream:
+            handler = BatchingJSONHandler(stream, batch_size=100, flush_interval=60)
+            for i in range(5):
+                handler.handle(self._record(f"msg {i}"))
+            handler.close()
+        
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == [f"msg {i}" for i in range(5)]
+    
+    def test_timer_flushes_quiet_logger(self):
+        """Test the background flusher drains records without further logging"""
+        stream = StringIO()
+        handler = BatchingJSONHandler(stream, batch_size=100, flush_interval=0.05)
+        try:
+            handler.handle(self._record("idle"))
+            deadline = time.monotonic() + 2
+            while not stream.getvalue() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            
+            assert json.loads(stream.getvalue())["message"] == "idle"
+        finally:
+            handler.close()
+
+
 class TestIntegration:
     """Integration tests for structured logging"""
     
@@ -565,6 +921,25 @@ class TestEdgeCases:
         
         assert 'Contains "quotes"' in data["extra"]["special"]
     
+    def test_numpy_array_in_extra(self):
+        """Test numpy arrays in extra data serialize as JSON lists"""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("orjson")
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test", level=logging.INFO,
+            pathname="/test.py", lineno=1,
+            msg="Test", args=(), exc_info=None
+        )
+        record.embedding = np.arange(4, dtype=np.float32)
+        
+        fast = json.loads(formatter.format(record))
+        record.big = 2 ** 70  # forces the stdlib fallback
+        fallback = json.loads(formatter.format(record))
+        
+        assert fast["extra"]["embedding"] == [0.0, 1.0, 2.0, 3.0]
+        assert fallback["extra"]["embedding"] == [0.0, 1.0, 2.0, 3.0]
+    
     def test_none_values_in_context(self):
         """Test None values in context don't break formatting"""
         with request_context(request_id="test", session_id=None):
@@ -165,7 +165,8 @@ class TestStructuredExceptionHandlers:
         request.method = "GET"
         return request
     
-    def test_create_structured_exception_handler_logs_error(self, mock_request, caplog):
+    @pytest.mark.asyncio
+    async def test_create_structured_exception_handler_logs_error(self, mock_request, caplog):
         """Test that structured exception handler logs errors"""
         async def mock_handler(request, exc):
             return {"handled": True}
@@ -179,10 +180,9 @@ class TestStructuredExceptionHandlers:
             return await mock_handler(request, exc)
         
         with caplog.at_level(logging.ERROR):
-            # Run the async handler
-            import asyncio
+            # Await the async handler directly in the test's event loop
             exc = MasterClawException("Test error")
-            result = asyncio.run(structured_handler(mock_request, exc))
+            result = await structured_handler(mock_request, exc)
         
         # Check that error was logged with request info
         assert "TestException" in caplog.text
@@ -223,6 +223,89 @@ class TestConfigureLogging:
         # Check that handler has console formatter
         if root_logger.handlers:
             assert isinstance(root_logger.handlers[0].formatter, ConsoleFormatter)
+    
+    def test_configure_logging_is_idempotent(self):
+        """Test repeated identical calls keep one handler; changes replace it"""
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+        try:
+            configure_logging(level="INFO", json_format=True)
+            installed = root_logger.handlers[:]
+            configure_logging(level="INFO", json_format=True)
+            assert root_logger.handlers == installed
+            assert len(installed) == 1
+            
+            configure_logging(level="INFO", json_format=False)
+            assert len(root_logger.handlers) == 1
+            assert root_logger.handlers[0] is not installed[0]
+            assert isinstance(root_logger.handlers[0].formatter, ConsoleFormatter)
+        finally:
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+    
+    def test_reconfigure_flushes_replaced_handler(self, capsys):
+        """Test records buffered by a replaced handler are written, not dropped"""
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+        try:
+            configure_logging(level="INFO", json_format=True, buffered=True)
+            get_logger("test.reconfigure").info("first")
+            configure_logging(level="INFO", json_format=False, buffered=False)
+            get_logger("test.reconfigure").info("second")
+            
+            out = capsys.readouterr().out
+            assert json.loads(out.splitlines()[0])["message"] == "first"
+            assert "second" in out.splitlines()[-1]
+        finally:
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+    
+    def test_configure_logging_async_queue(self, capsys):
+        """Test queued logging keeps context and exceptions once drained"""
+        from masterclaw_core.structured_logger import _stop_queue_listener
+        
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+        configure_logging(level="INFO", json_format=True, async_queue=True)
+        try:
+            logger = get_logger("test.queued")
+            with request_context(request_id="queued-123"):
+                try:
+                    raise ValueError("boom")
+                except ValueError:
+                    logger.exception("Queued failure", attempt=2)
+            _stop_queue_listener()
+            
+            data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+            assert data["message"] == "Queued failure"
+            assert data["request_id"] == "queued-123"
+            assert data["extra"]["attempt"] == 2
+            assert data["exception"]["type"] == "ValueError"
+        finally:
+            # Don't leave a handler bound to capsys's soon-closed stream
+            _stop_queue_listener()
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+
+
+    def test_stopping_queue_listener_flushes_buffered_records(self, capsys):
+        """Test INFO records buffered behind the queue are written on stop"""
+        from masterclaw_core.structured_logger import _stop_queue_listener
+        
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+        configure_logging(level="INFO", json_format=True, async_queue=True, buffered=True)
+        try:
+            # INFO is below the buffered handler's flush level, so it waits
+            get_logger("test.queued").info("Queued info")
+            _stop_queue_listener()
+            
+            data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+            assert data["message"] == "Queued info"
+        finally:
+            _stop_queue_listener()
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
 
 
 class TestStructuredLogger:
@@ -274,10 +357,9 @@ class TestStructuredLogger:
 class TestIntegrationWithRequestContext:
     """Integration tests for structured logging with request context"""
     
-    def test_logging_with_request_context(self, caplog):
+    @pytest.mark.asyncio
+    async def test_logging_with_request_context(self, caplog):
         """Test that logs include request context"""
-        import asyncio
-        
         async def async_test():
             with request_context(
                 request_id="req-123",
@@ -288,7 +370,7 @@ class TestIntegrationWithRequestContext:
                 logger.info("Test message with context")
         
         with caplog.at_level(logging.INFO):
-            asyncio.run(async_test())
+            await async_test()
         
         # The log should contain the message
         assert "Test message with context" in caplog.text
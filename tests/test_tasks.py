@@ -10,8 +10,8 @@ Comprehensive test coverage for TaskQueue including:
 
 import pytest
 import asyncio
+import time
 from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime, timezone
 
 from masterclaw_core.tasks import TaskQueue, task_queue
 
@@ -42,7 +42,7 @@ class TestTaskQueueBasic:
             task_id = await q.submit(simple_task)
             
             # Wait for task to complete
-            await asyncio.sleep(0.1)
+            await q.queue.join()
             
             assert len(result) == 1
             assert result[0] == "executed"
@@ -64,7 +64,7 @@ class TestTaskQueueBasic:
                 result.append("async_executed")
             
             await q.submit(async_task)
-            await asyncio.sleep(0.15)
+            await q.queue.join()
             
             assert len(result) == 1
             assert result[0] == "async_executed"
@@ -87,7 +87,7 @@ class TestTaskQueueBasic:
                 result['d'] = d
             
             await q.submit(task_with_args, 1, 2, c=3, d=4)
-            await asyncio.sleep(0.1)
+            await q.queue.join()
             
             assert result == {'a': 1, 'b': 2, 'c': 3, 'd': 4}
         finally:
@@ -108,7 +108,7 @@ class TestTaskQueueBasic:
             for i in range(5):
                 await q.submit(task, i)
             
-            await asyncio.sleep(0.3)
+            await q.queue.join()
             
             assert len(results) == 5
             assert results == [0, 1, 2, 3, 4]
@@ -130,9 +130,9 @@ class TestTaskQueueConcurrency:
             end_times = {}
             
             async def timed_task(task_id):
-                start_times[task_id] = datetime.now(timezone.utc)
+                start_times[task_id] = time.monotonic_ns()
                 await asyncio.sleep(0.1)  # Simulate work
-                end_times[task_id] = datetime.now(timezone.utc)
+                end_times[task_id] = time.monotonic_ns()
             
             # Submit 3 tasks simultaneously
             tasks = []
@@ -141,7 +141,7 @@ class TestTaskQueueConcurrency:
                 tasks.append(task_id)
             
             # Wait for all to complete
-            await asyncio.sleep(0.2)
+            await q.queue.join()
             
             # With 3 workers, all should start around the same time
             # Check that tasks ran concurrently (overlap in execution)
@@ -151,7 +151,7 @@ class TestTaskQueueConcurrency:
             # All start times should be within 50ms of each other
             start_times_list = [start_times[f"task_{i}"] for i in range(3)]
             time_spread = max(start_times_list) - min(start_times_list)
-            assert time_spread.total_seconds() < 0.05  # Should start almost simultaneously
+            assert time_spread < 50_000_000  # Should start almost simultaneously (ns)
         finally:
             await q.stop()
     
@@ -212,7 +212,7 @@ class TestTaskQueueErrors:
             await q.submit(failing_task)
             await q.submit(successful_task)
             
-            await asyncio.sleep(0.2)
+            await q.queue.join()
             
             # Both should have been attempted
             assert len(error_triggered) == 2
@@ -233,7 +233,7 @@ class TestTaskQueueErrors:
                 raise RuntimeError("Async task failed")
             
             await q.submit(async_failing_task)
-            await asyncio.sleep(0.1)
+            await q.queue.join()
             
             # Queue should still be operational
             assert q.running is True
@@ -257,7 +257,7 @@ class TestTaskQueueErrors:
             await q.submit(fail_then_succeed)
             await q.submit(fail_then_succeed)
             
-            await asyncio.sleep(0.2)
+            await q.queue.join()
             
             # Both tasks should have been attempted
             assert len(results) == 2
@@ -310,6 +310,20 @@ class TestTaskQueueLifecycle:
         
         await q.stop()
     
+    @pytest.mark.asyncio
+    async def test_stop_idle_queue_is_prompt(self):
+        """Test idle workers are released immediately rather than polling"""
+        q = TaskQueue(max_workers=3)
+        await q.start()
+        await asyncio.sleep(0)  # let workers park on the queue
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await q.stop()
+        
+        assert loop.time() - started < 0.5
+        assert q.workers == []
+    
     @pytest.mark.asyncio
     async def test_stop_without_start(self):
         """Test that stop works even if start was never called"""
@@ -410,7 +424,7 @@ class TestTaskQueueEdgeCases:
                 result.append(inner_result)
             
             await q.submit(outer)
-            await asyncio.sleep(0.1)
+            await q.queue.join()
             
             assert result == ["inner"]
         finally:
@@ -428,12 +442,84 @@ class TestTaskQueueEdgeCases:
             
             # Should not raise
             await q.submit(task_with_return)
-            await asyncio.sleep(0.1)
+            await q.queue.join()
             
             # Queue should still be running
             assert q.running is True
         finally:
             await q.stop()
+    
+    def test_default_queue_bound_scales_with_workers(self):
+        """Test the queue is bounded relative to the worker count by default"""
+        assert TaskQueue(max_workers=2).queue.maxsize == 2 * TaskQueue.QUEUE_SIZE_PER_WORKER
+        assert TaskQueue(max_workers=2, maxsize=0).queue.maxsize == 0
+    
+    @pytest.mark.asyncio
+    async def test_submit_waits_when_queue_full(self):
+        """Test a full queue applies backpressure to submit"""
+        q = TaskQueue(max_workers=1, maxsize=2)
+        
+        def dummy_task():
+            pass
+        
+        await q.submit(dummy_task)
+        await q.submit(dummy_task)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(q.submit(dummy_task), timeout=0.05)
+        
+        # Starting a worker drains the queue and makes room again
+        await q.start()
+        try:
+            await asyncio.wait_for(q.submit(dummy_task), timeout=1)
+            await q.queue.join()
+        finally:
+            await q.stop()
+    
+    @pytest.mark.asyncio
+    async def test_submit_nowait_raises_when_full(self):
+        """Test submit_nowait reports a full queue instead of waiting"""
+        q = TaskQueue(max_workers=1, maxsize=1)
+        
+        def dummy_task():
+            pass
+        
+        assert q.submit_nowait(dummy_task).startswith("task_")
+        with pytest.raises(asyncio.QueueFull):
+            q.submit_nowait(dummy_task)
+    
+    @pytest.mark.asyncio
+    async def test_submit_after_stop_raises_when_full(self):
+        """Test a stopped, full queue fails fast rather than blocking forever"""
+        q = TaskQueue(max_workers=1, maxsize=1)
+        await q.start()
+        await q.stop()
+        
+        def dummy_task():
+            pass
+        
+        await q.submit(dummy_task)
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(q.submit(dummy_task), timeout=1)
+    
+    @pytest.mark.asyncio
+    async def test_stop_wakes_blocked_submit(self):
+        """Test a producer waiting for room is failed by stop(), not left hanging"""
+        q = TaskQueue(max_workers=1, maxsize=1)
+        release = asyncio.Event()
+        await q.start()
+        
+        await q.submit(release.wait)  # Occupies the only worker
+        await asyncio.sleep(0)
+        await q.submit(release.wait)  # Fills the queue
+        producer = asyncio.ensure_future(q.submit(release.wait))
+        await asyncio.sleep(0)
+        assert not producer.done()
+        
+        stopping = asyncio.ensure_future(q.stop())
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(producer, timeout=1)
+        release.set()
+        await asyncio.wait_for(stopping, timeout=1)
 
 
 class TestGlobalTaskQueue:
@@ -473,7 +559,7 @@ class TestTaskQueueLogging:
                     pass
                 
                 await q.submit(simple_task)
-                await asyncio.sleep(0.1)
+                await q.queue.join()
                 
                 # Check for completion log
                 assert any("Task completed" in record.message for record in caplog.records)
@@ -494,7 +580,7 @@ class TestTaskQueueLogging:
                     raise ValueError("Test error")
                 
                 await q.submit(failing_task)
-                await asyncio.sleep(0.1)
+                await q.queue.join()
                 
                 # Check for error log
                 assert any("Task failed" in record.message for record in caplog.records)
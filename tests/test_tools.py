@@ -12,6 +12,7 @@ Covers:
 """
 
 import os
+import re
 import sys
 import json
 import pytest
@@ -218,11 +219,59 @@ class TestBaseTool:
         assert valid is False
         assert "must be one of" in error
 
+        # Unhashable values are rejected rather than raising
+        valid, error = mock_tool_with_enum.validate_params({"color": ["red"]})
+        assert valid is False
+        assert "must be one of" in error
+
+        valid, error = mock_tool_with_enum.validate_params({"color": "red"})
+        assert valid is True
+
 
 # =============================================================================
 # GitHubTool Tests
 # =============================================================================
 
+# Canned Open-Meteo "current" payload
+_CURRENT_WEATHER = {
+    "current": {
+        "temperature_2m": 20.5,
+        "relative_humidity_2m": 65,
+        "apparent_temperature": 21.0,
+        "precipitation": 0.0,
+        "weather_code": 1,
+        "wind_speed_10m": 10.5
+    }
+}
+
+
+# Any Open-Meteo request, whatever its query string
+_OPEN_METEO_URL = re.compile(r"https://api\.open-meteo\.com/.*")
+
+
+@pytest.fixture(autouse=True)
+def no_network(httpx_mock):
+    """Keep every test in this module off the network
+    
+    pytest-httpx intercepts the httpx transport, so a request with no
+    registered response fails instead of leaving the machine.
+    """
+    return httpx_mock
+
+
+# Every GitHubTool parameter defaults to required, so action tests pass
+# placeholders for the ones their action does not use
+_GITHUB_REQUIRED_PARAMS = {
+    "owner": "testuser",
+    "repo": "dummy",
+    "issue_number": 1,
+    "title": "dummy",
+    "body": "dummy",
+    "state": "open",
+    "per_page": 30,
+}
+
+
 class TestGitHubTool:
     """Test the GitHubTool"""
 
@@ -239,6 +288,10 @@ class TestGitHubTool:
         assert defn.dangerous is False
         assert len(defn.parameters) > 0
 
+    def test_definition_built_once(self, github_tool):
+        """Test the static definition is cached per tool instance"""
+        assert github_tool.definition is github_tool.definition
+
     def test_missing_token_error(self):
         """Test error when token not configured"""
         tool = GitHubTool()
@@ -281,6 +334,7 @@ class TestGitHubTool:
                 "updated_at": "2024-01-01T00:00:00Z"
             }
         ]
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
@@ -291,16 +345,9 @@ class TestGitHubTool:
 
         # Note: Many params are marked as required in the definition that
         # list_repos doesn't actually need. Providing them for validation.
-        result = await github_tool.execute({
-            "action": "list_repos",
-            "owner": "testuser",
-            "repo": "dummy",
-            "issue_number": 1,
-            "title": "dummy",
-            "body": "dummy",
-            "state": "open",
-            "per_page": 30
-        })
+        result = await github_tool.execute(
+            {"action": "list_repos", **_GITHUB_REQUIRED_PARAMS}
+        )
 
         assert result.success is True
         assert "repositories" in result.data
@@ -320,30 +367,66 @@ class TestGitHubTool:
         mock_client_class.return_value = mock_client
 
         # Note: Many params are marked as required in the definition
-        result = await github_tool.execute({
-            "action": "list_repos",
-            "owner": "testuser",
-            "repo": "dummy",
-            "issue_number": 1,
-            "title": "dummy",
-            "body": "dummy",
-            "state": "open",
-            "per_page": 30
-        })
+        result = await github_tool.execute(
+            {"action": "list_repos", **_GITHUB_REQUIRED_PARAMS}
+        )
 
         assert result.success is False
         assert "GitHub API error" in result.error
 
+    @pytest.mark.asyncio
+    async def test_large_response_decoded_off_loop(self):
+        """Test large JSON bodies are decoded in a worker thread"""
+        from masterclaw_core import tools
+
+        resp = MagicMock()
+        resp.content = b'{"k": [1, 2, 3]}'
+        resp.json.return_value = {"k": [1, 2, 3]}
+        with patch.object(tools, "_JSON_OFFLOAD_BYTES", 4), \
+                patch("asyncio.to_thread", wraps=tools.asyncio.to_thread) as to_thread:
+            assert await tools._response_json(resp) == {"k": [1, 2, 3]}
+        assert to_thread.called == tools.ORJSON_AVAILABLE
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_client_reused_and_closed(self, mock_client_class, github_tool):
+        """Test actions share one HTTP client until aclose()"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = []
+        mock_response.content = b"[]"
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client_class.return_value = mock_client
+
+        params = {"action": "list_repos", **_GITHUB_REQUIRED_PARAMS}
+        await github_tool.execute(params)
+        await github_tool.execute(params)
+
+        assert mock_client_class.call_count == 1
+        assert mock_client.get.await_count == 2
+
+        await github_tool.aclose()
+        mock_client.aclose.assert_awaited_once()
+
 
 # =============================================================================
 # SystemTool Tests
 # =============================================================================
 
+def _fake_process(stdout=b"", stderr=b"", returncode=0):
+    """Stand-in for the process returned by asyncio.create_subprocess_exec"""
+    proc = MagicMock(returncode=returncode)
+    proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    return proc
+
+
 class TestSystemTool:
     """Test the SystemTool"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def system_tool(self):
+        """Stateless tool shared by the tests in this class"""
         return SystemTool()
 
     def test_definition_structure(self, system_tool):
@@ -379,36 +462,48 @@ class TestSystemTool:
         assert "not in safe list" in result.error.lower()
 
     @pytest.mark.asyncio
-    @patch("subprocess.run")
-    async def test_exec_safe_command(self, mock_run, system_tool):
+    @patch("asyncio.create_subprocess_shell")
+    async def test_exec_safe_command(self, mock_shell, system_tool):
         """Test executing a safe command"""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="test output",
-            stderr=""
-        )
+        mock_shell.return_value = _fake_process(stdout=b"test output")
 
         result = await system_tool.execute({
             "action": "exec",
-            "command": "echo hello"
+            "command": "echo 'hello world'"
         })
 
         assert result.success is True
         assert result.data["stdout"] == "test output"
+        assert mock_shell.call_args.args == ("echo 'hello world'",)
+
+    @pytest.mark.asyncio
+    async def test_exec_expands_globs(self, system_tool, tmp_path, monkeypatch):
+        """Test allowed commands still get shell glob expansion"""
+        (tmp_path / "a.py").touch()
+        (tmp_path / "b.py").touch()
+        (tmp_path / "notes.txt").touch()
+        monkeypatch.chdir(tmp_path)
+
+        result = await system_tool.execute({
+            "action": "exec",
+            "command": "ls *.py"
+        })
+
+        assert result.success is True
+        assert result.data["stdout"].split() == ["a.py", "b.py"]
 
     @pytest.mark.asyncio
     async def test_exec_timeout(self, system_tool):
         """Test command timeout handling"""
-        import subprocess
-
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 30)):
+        # A real process that never exits on its own, killed after the timeout
+        with patch.object(SystemTool, "EXEC_TIMEOUT", 0.05):
             result = await system_tool.execute({
                 "action": "exec",
-                "command": "echo hello"
+                "command": "tail -f /dev/null"
             })
 
-            assert result.success is False
-            assert "timed out" in result.error.lower()
+        assert result.success is False
+        assert "timed out" in result.error.lower()
 
     @pytest.mark.asyncio
     async def test_get_info(self, system_tool):
@@ -420,12 +515,11 @@ class TestSystemTool:
         assert "python_version" in result.data
 
     @pytest.mark.asyncio
-    @patch("subprocess.run")
-    async def test_disk_usage(self, mock_run, system_tool):
+    @patch("asyncio.create_subprocess_exec")
+    async def test_disk_usage(self, mock_exec, system_tool):
         """Test disk usage command"""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="Filesystem Size Used Avail Use% Mounted on\n/dev/sda1 100G 50G 50G 50% /"
+        mock_exec.return_value = _fake_process(
+            stdout=b"Filesystem Size Used Avail Use% Mounted on\n/dev/sda1 100G 50G 50G 50% /"
         )
 
         result = await system_tool.execute({
@@ -443,8 +537,9 @@ class TestSystemTool:
 class TestWeatherTool:
     """Test the WeatherTool"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def weather_tool(self):
+        """Stateless tool shared by the tests in this class"""
         return WeatherTool()
 
     def test_definition_structure(self, weather_tool):
@@ -461,27 +556,9 @@ class TestWeatherTool:
         # The tool validates params in BaseTool.validate_params
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_get_current_weather(self, mock_client_class, weather_tool):
+    async def test_get_current_weather(self, weather_tool, httpx_mock):
         """Test getting current weather"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "current": {
-                "temperature_2m": 20.5,
-                "relative_humidity_2m": 65,
-                "apparent_temperature": 21.0,
-                "precipitation": 0.0,
-                "weather_code": 1,
-                "wind_speed_10m": 10.5
-            }
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_class.return_value = mock_client
+        httpx_mock.add_response(url=_OPEN_METEO_URL, json=_CURRENT_WEATHER)
 
         result = await weather_tool.execute({
             "action": "current",
@@ -495,11 +572,9 @@ class TestWeatherTool:
         assert result.data["temperature_c"] == 20.5
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_get_forecast(self, mock_client_class, weather_tool):
+    async def test_get_forecast(self, weather_tool, httpx_mock):
         """Test getting weather forecast"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        httpx_mock.add_response(url=_OPEN_METEO_URL, json={
             "daily": {
                 "time": ["2024-01-01", "2024-01-02"],
                 "temperature_2m_max": [22.0, 23.0],
@@ -507,14 +582,7 @@ class TestWeatherTool:
                 "precipitation_sum": [0.0, 1.5],
                 "weather_code": [1, 2]
             }
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_class.return_value = mock_client
+        })
 
         result = await weather_tool.execute({
             "action": "forecast",
@@ -540,22 +608,27 @@ class TestToolRegistry:
         """Create a fresh registry for testing"""
         return ToolRegistry()
 
-    def test_builtin_tools_registered(self, clean_registry):
+    @pytest.fixture(scope="class")
+    def shared_registry(self):
+        """Registry shared by tests that do not register or unregister tools"""
+        return ToolRegistry()
+
+    def test_builtin_tools_registered(self, shared_registry):
         """Test that built-in tools are auto-registered"""
-        tools = clean_registry.list_tools()
+        tools = shared_registry.list_tools()
         assert "github" in tools
         assert "system" in tools
         assert "weather" in tools
 
-    def test_get_existing_tool(self, clean_registry):
+    def test_get_existing_tool(self, shared_registry):
         """Test getting a registered tool"""
-        tool = clean_registry.get("github")
+        tool = shared_registry.get("github")
         assert tool is not None
         assert tool.definition.name == "github"
 
-    def test_get_nonexistent_tool(self, clean_registry):
+    def test_get_nonexistent_tool(self, shared_registry):
         """Test getting non-existent tool returns None"""
-        tool = clean_registry.get("nonexistent")
+        tool = shared_registry.get("nonexistent")
         assert tool is None
 
     def test_register_new_tool(self, clean_registry):
@@ -566,6 +639,15 @@ class TestToolRegistry:
         assert "mock" in clean_registry.list_tools()
         assert clean_registry.get("mock") == custom_tool
 
+    def test_register_many(self, clean_registry):
+        """Test registering several tools at once"""
+        clean_registry.get_definitions()
+        custom_tool = MockTool()
+        clean_registry.register_many([custom_tool])
+
+        assert clean_registry.get("mock") is custom_tool
+        assert len(clean_registry.get_definitions()) == 4
+
     def test_unregister_tool(self, clean_registry):
         """Test unregistering a tool"""
         result = clean_registry.unregister("weather")
@@ -577,9 +659,9 @@ class TestToolRegistry:
         result = clean_registry.unregister("nonexistent")
         assert result is False
 
-    def test_get_definitions_openai_format(self, clean_registry):
+    def test_get_definitions_openai_format(self, shared_registry):
         """Test getting definitions in OpenAI format"""
-        definitions = clean_registry.get_definitions()
+        definitions = shared_registry.get_definitions()
 
         assert len(definitions) == 3  # github, system, weather
 
@@ -592,9 +674,9 @@ class TestToolRegistry:
             assert "description" in func
             assert "parameters" in func
 
-    def test_get_tools_info(self, clean_registry):
+    def test_get_tools_info(self, shared_registry):
         """Test getting tool information"""
-        info = clean_registry.get_tools_info()
+        info = shared_registry.get_tools_info()
 
         assert len(info) == 3
 
@@ -605,21 +687,38 @@ class TestToolRegistry:
             assert "requires_confirmation" in tool_info
             assert "dangerous" in tool_info
 
+    def test_definitions_cached_until_registry_changes(self, clean_registry):
+        """Test serialized views are reused and rebuilt after register/unregister"""
+        definitions = clean_registry.get_definitions()
+        info = clean_registry.get_tools_info()
+        assert clean_registry.get_definitions() is definitions
+        assert clean_registry.get_tools_info() is info
+
+        clean_registry.register(MockTool())
+        assert len(clean_registry.get_definitions()) == 4
+        assert "mock" in [t["name"] for t in clean_registry.get_tools_info()]
+
+        clean_registry.unregister("mock")
+        assert len(clean_registry.get_definitions()) == 3
+        assert len(clean_registry.get_tools_info()) == 3
+
     @pytest.mark.asyncio
-    async def test_execute_existing_tool(self, clean_registry):
+    async def test_execute_existing_tool(self, clean_registry, httpx_mock):
         """Test executing an existing tool"""
+        httpx_mock.add_response(url=_OPEN_METEO_URL, json=_CURRENT_WEATHER)
         result = await clean_registry.execute("weather", {
             "action": "current",
             "latitude": 0,
             "longitude": 0
         })
-        # May succeed or fail depending on network, but should return ToolResult
         assert isinstance(result, ToolResult)
+        assert result.success is True
+        assert result.data["temperature_c"] == 20.5
 
     @pytest.mark.asyncio
-    async def test_execute_nonexistent_tool(self, clean_registry):
+    async def test_execute_nonexistent_tool(self, shared_registry):
         """Test executing non-existent tool"""
-        result = await clean_registry.execute("nonexistent", {})
+        result = await shared_registry.execute("nonexistent", {})
 
         assert result.success is False
         assert "not found" in result.error
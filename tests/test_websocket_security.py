@@ -10,10 +10,13 @@ This module tests the security hardening of the WebSocket implementation includi
 
 import pytest
 import asyncio
-import time
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 import json
+from types import SimpleNamespace
+
+import time_machine
+from fastapi import WebSocket
 
 from masterclaw_core.websocket import (
     ConnectionManager,
@@ -42,12 +45,38 @@ def mock_websocket():
     return ws
 
 
+@pytest.fixture
+def make_ws():
+    """Factory for mock WebSockets with a given client IP and X-Forwarded-For"""
+    def _make(ip="127.0.0.1", xff=None):
+        ws = MagicMock(spec=WebSocket)
+        ws.accept = AsyncMock()
+        ws.close = AsyncMock()
+        ws.send_json = AsyncMock()
+        ws.client = SimpleNamespace(host=ip)
+        ws.headers = {"x-forwarded-for": xff} if xff else {}
+        return ws
+    return _make
+
+
 @pytest.fixture
 def connection_manager():
     """Create a fresh ConnectionManager instance"""
     return ConnectionManager()
 
 
+@pytest.fixture
+def limited_manager():
+    """ConnectionManager with small limits so filling them stays cheap"""
+    return ConnectionManager(max_connections_per_session=3, max_connections_per_ip=3)
+
+
+@pytest.fixture(scope="module")
+def shared_connection_manager():
+    """ConnectionManager shared by tests that never connect or disconnect"""
+    return ConnectionManager()
+
+
 class TestConnectionInfo:
     """Tests for ConnectionInfo dataclass"""
     
@@ -65,23 +94,24 @@ class TestConnectionInfo:
     def test_connection_info_expired(self):
         """Test is_expired returns True for old connections"""
         ws = MagicMock()
-        info = ConnectionInfo(websocket=ws)
-        
-        # Connection should not be expired initially
-        assert not info.is_expired()
-        
-        # Manually set connected_at to past
-        info.connected_at = datetime.utcnow() - timedelta(seconds=CONNECTION_TIMEOUT_SECONDS + 1)
-        assert info.is_expired()
+        with time_machine.travel(datetime(2024, 1, 1, tzinfo=timezone.utc), tick=False) as traveller:
+            info = ConnectionInfo(websocket=ws)
+            
+            # Connection should not be expired initially
+            assert not info.is_expired()
+            
+            traveller.shift(CONNECTION_TIMEOUT_SECONDS + 1)
+            assert info.is_expired()
     
     def test_update_activity(self):
         """Test update_activity increments message count and updates timestamp"""
         ws = MagicMock()
-        info = ConnectionInfo(websocket=ws)
-        old_activity = info.last_activity
-        
-        time.sleep(0.01)  # Small delay to ensure timestamp changes
-        info.update_activity()
+        with time_machine.travel(datetime(2024, 1, 1, tzinfo=timezone.utc), tick=False) as traveller:
+            info = ConnectionInfo(websocket=ws)
+            old_activity = info.last_activity
+            traveller.shift(0.001)
+            
+            info.update_activity()
         
         assert info.message_count == 1
         assert info.last_activity > old_activity
@@ -112,60 +142,68 @@ class TestRateLimitInfo:
     
     def test_rate_limit_window_expiration(self):
         """Test that old messages are cleaned from window"""
-        rl = RateLimitInfo()
+        now = [1000.0]
+        rl = RateLimitInfo(clock=lambda: now[0])
         
-        # Add a message from outside the window
-        old_time = time.time() - RATE_LIMIT_WINDOW - 1
-        rl.message_times.append(old_time)
+        # Fill the limit, then move the clock past the window
+        for _ in range(RATE_LIMIT_MAX_MESSAGES):
+            rl.record_message()
+        assert rl.is_rate_limited()
+        now[0] += RATE_LIMIT_WINDOW + 1
         
-        # Should not be rate limited with just one old message
+        # Should not be rate limited once the messages age out
         assert not rl.is_rate_limited()
-        # Old message should be cleaned
+        # Old messages should be cleaned
         assert len(rl.message_times) == 0
+    
+    def test_message_history_is_bounded(self):
+        """Test only the newest RATE_LIMIT_MAX_MESSAGES timestamps are kept"""
+        rl = RateLimitInfo()
+        for _ in range(RATE_LIMIT_MAX_MESSAGES * 2):
+            rl.record_message()
+        
+        assert len(rl.message_times) == RATE_LIMIT_MAX_MESSAGES
+        assert rl.is_rate_limited()
 
 
 class TestConnectionManagerValidation:
     """Tests for ConnectionManager validation methods"""
     
-    def test_validate_valid_session_id(self, connection_manager):
+    @pytest.mark.parametrize("session_id", [
+        "abc123",
+        "session_123",
+        "test-session",
+        "a" * 64,  # Max length
+    ])
+    def test_validate_valid_session_id(self, shared_connection_manager, session_id):
         """Test valid session IDs pass validation"""
-        valid_ids = [
-            "abc123",
-            "session_123",
-            "test-session",
-            "a" * 64,  # Max length
-        ]
-        
-        for session_id in valid_ids:
-            assert connection_manager._validate_session_id(session_id), f"Failed for {session_id}"
+        assert shared_connection_manager._validate_session_id(session_id)
     
-    def test_validate_invalid_session_id(self, connection_manager):
+    @pytest.mark.parametrize("session_id", [
+        "",  # Empty
+        "a" * 65,  # Too long
+        "test.session",  # Invalid chars
+        "test session",  # Space
+        "test<script>",  # Script tag
+        "../../../etc/passwd",  # Path traversal
+    ])
+    def test_validate_invalid_session_id(self, shared_connection_manager, session_id):
         """Test invalid session IDs fail validation"""
-        invalid_ids = [
-            "",  # Empty
-            "a" * 65,  # Too long
-            "test.session",  # Invalid chars
-            "test session",  # Space
-            "test<script>",  # Script tag
-            "../../../etc/passwd",  # Path traversal
-        ]
-        
-        for session_id in invalid_ids:
-            assert not connection_manager._validate_session_id(session_id), f"Failed for {session_id}"
+        assert not shared_connection_manager._validate_session_id(session_id)
     
-    def test_get_client_ip_from_x_forwarded_for(self, connection_manager, mock_websocket):
+    def test_get_client_ip_from_x_forwarded_for(self, shared_connection_manager, mock_websocket):
         """Test IP extraction from X-Forwarded-For header"""
         mock_websocket.headers = {"x-forwarded-for": "192.168.1.100, 10.0.0.1"}
         
-        ip = connection_manager._get_client_ip(mock_websocket)
+        ip = shared_connection_manager._get_client_ip(mock_websocket)
         assert ip == "192.168.1.100"
     
-    def test_get_client_ip_from_client(self, connection_manager, mock_websocket):
+    def test_get_client_ip_from_client(self, shared_connection_manager, mock_websocket):
         """Test IP extraction from client when no header"""
         mock_websocket.headers = {}
         mock_websocket.client.host = "10.0.0.5"
         
-        ip = connection_manager._get_client_ip(mock_websocket)
+        ip = shared_connection_manager._get_client_ip(mock_websocket)
         assert ip == "10.0.0.5"
 
 
@@ -173,69 +211,43 @@ class TestConnectionLimits:
     """Tests for connection limit enforcement"""
     
     @pytest.mark.asyncio
-    async def test_connection_limit_per_session(self, connection_manager, mock_websocket):
+    async def test_connection_limit_per_session(self, limited_manager, make_ws):
         """Test max connections per session is enforced"""
         session_id = "test-session"
         
         # Create max connections
-        websockets = []
-        for i in range(MAX_CONNECTIONS_PER_SESSION):
-            ws = MagicMock()
-            ws.accept = AsyncMock()
-            ws.headers = {}
-            ws.client = MagicMock()
-            ws.client.host = f"127.0.0.{i}"
-            ws.close = AsyncMock()
-            ws.send_json = AsyncMock()
-            
-            connected = await connection_manager.connect(ws, session_id)
-            assert connected, f"Connection {i} should succeed"
-            websockets.append(ws)
+        websockets = [make_ws(ip=f"127.0.0.{i}") for i in range(limited_manager.max_connections_per_session)]
+        results = await asyncio.gather(*(limited_manager.connect(ws, session_id) for ws in websockets))
+        assert all(results)
         
         # Next connection should fail
-        extra_ws = MagicMock()
-        extra_ws.accept = AsyncMock()
-        extra_ws.headers = {}
-        extra_ws.client = MagicMock()
-        extra_ws.client.host = "127.0.0.99"
-        extra_ws.close = AsyncMock()
-        extra_ws.send_json = AsyncMock()
-        
-        connected = await connection_manager.connect(extra_ws, session_id)
+        extra_ws = make_ws(ip="127.0.0.99")
+        connected = await limited_manager.connect(extra_ws, session_id)
         assert not connected
         extra_ws.close.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_connection_limit_per_ip(self, connection_manager, mock_websocket):
+    async def test_connection_limit_per_ip(self, limited_manager, make_ws):
         """Test max connections per IP is enforced"""
         same_ip = "192.168.1.50"
         
         # Create max connections from same IP
-        websockets = []
-        for i in range(MAX_CONNECTIONS_PER_IP):
-            ws = MagicMock()
-            ws.accept = AsyncMock()
-            ws.headers = {"x-forwarded-for": same_ip}
-            ws.client = MagicMock()
-            ws.client.host = same_ip
-            ws.close = AsyncMock()
-            ws.send_json = AsyncMock()
-            
-            connected = await connection_manager.connect(ws, f"session-{i}")
-            assert connected, f"Connection {i} should succeed"
-            websockets.append(ws)
+        results = await asyncio.gather(*(
+            limited_manager.connect(make_ws(ip=same_ip, xff=same_ip), f"session-{i}")
+            for i in range(limited_manager.max_connections_per_ip)
+        ))
+        assert all(results)
         
         # Next connection from same IP should fail
-        extra_ws = MagicMock()
-        extra_ws.accept = AsyncMock()
-        extra_ws.headers = {"x-forwarded-for": same_ip}
-        extra_ws.client = MagicMock()
-        extra_ws.client.host = same_ip
-        extra_ws.close = AsyncMock()
-        extra_ws.send_json = AsyncMock()
-        
-        connected = await connection_manager.connect(extra_ws, "extra-session")
+        extra_ws = make_ws(ip=same_ip, xff=same_ip)
+        connected = await limited_manager.connect(extra_ws, "extra-session")
         assert not connected
+    
+    def test_limits_reported_in_stats(self, limited_manager):
+        """Test overridden limits are the ones reported for monitoring"""
+        stats = limited_manager.get_connection_stats()
+        assert stats["max_connections_per_session"] == 3
+        assert stats["max_connections_per_ip"] == 3
 
 
 class TestRateLimiting:
@@ -315,9 +327,9 @@ class TestMessageValidation:
 class TestConnectionStats:
     """Tests for connection statistics"""
     
-    def test_get_connection_stats_empty(self, connection_manager):
+    def test_get_connection_stats_empty(self, shared_connection_manager):
         """Test stats with no connections"""
-        stats = connection_manager.get_connection_stats()
+        stats = shared_connection_manager.get_connection_stats()
         
         assert stats["total_connections"] == 0
         assert stats["unique_sessions"] == 0
@@ -330,16 +342,10 @@ class TestDisconnectCleanup:
     """Tests for connection cleanup on disconnect"""
     
     @pytest.mark.asyncio
-    async def test_disconnect_removes_all_tracking(self, connection_manager):
+    async def test_disconnect_removes_all_tracking(self, connection_manager, make_ws):
         """Test disconnect cleans up all tracking data structures"""
         # Create connection
-        ws = MagicMock()
-        ws.accept = AsyncMock()
-        ws.headers = {"x-forwarded-for": "192.168.1.10"}
-        ws.client = MagicMock()
-        ws.client.host = "192.168.1.10"
-        ws.close = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws = make_ws(ip="192.168.1.10", xff="192.168.1.10")
         
         session_id = "cleanup-test"
         